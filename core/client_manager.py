@@ -10,6 +10,15 @@ class ClientManager:
 
     def __init__(self):
         self.db = get_database()
+        # PERFORMANCE: get_clients() results keyed by query, cleared on any
+        # mutation; the version stops an in-flight query caching stale rows
+        self._clients_cache: Dict[tuple, List[Dict]] = {}
+        self._clients_version = 0
+
+    def _invalidate_clients(self):
+        """Drop cached client lists after a mutation."""
+        self._clients_version += 1
+        self._clients_cache.clear()
 
     def add_client(self, data: Dict) -> int:
         """
@@ -38,19 +47,29 @@ class ClientManager:
             data.get('role', 'Producer')
         ))
         conn.commit()
+        self._invalidate_clients()
         return cursor.lastrowid
 
-    def get_clients(self, sort_by: str = 'name', search: str = None) -> List[Dict]:
+    def get_clients(self, sort_by: str = 'name', search: str = None, role: str = None) -> List[Dict]:
         """
         Get all clients/contacts.
 
         Args:
             sort_by: Field to sort by ('name', 'created_at', 'role').
-            search: Optional search string to filter by name.
+            search: Optional search string to filter by name or email.
+            role: Optional role to filter by ('Producer', 'Artist').
 
         Returns:
-            List of client dicts (includes role field).
+            List of client dicts (includes role field). Repeated queries are
+            served from a cache; the list is a fresh copy but the dicts are
+            shared, so treat them as read-only.
         """
+        key = (sort_by, search, role)
+        cached = self._clients_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        version = self._clients_version
+
         conn = self.db._get_connection()
         cursor = conn.cursor()
 
@@ -58,16 +77,24 @@ class ClientManager:
         valid_sorts = {'name': 'name', 'created_at': 'created_at', 'id': 'id', 'role': 'role'}
         sort_field = valid_sorts.get(sort_by, 'name')
 
+        # PERFORMANCE: Filter in SQL so only matching rows are transferred
+        conditions = []
+        params = []
         if search:
-            cursor.execute(f'''
-                SELECT * FROM clients
-                WHERE name LIKE ?
-                ORDER BY {sort_field}
-            ''', (f'%{search}%',))
-        else:
-            cursor.execute(f'SELECT * FROM clients ORDER BY {sort_field}')
+            conditions.append('(name LIKE ? COLLATE NOCASE OR email LIKE ? COLLATE NOCASE)')
+            pattern = f'%{search}%'
+            params.extend((pattern, pattern))
+        if role:
+            conditions.append('role = ?')
+            params.append(role)
+
+        where = f'WHERE {" AND ".join(conditions)}' if conditions else ''
+        cursor.execute(f'SELECT * FROM clients {where} ORDER BY {sort_field}', params)
 
-        return [dict(row) for row in cursor.fetchall()]
+        clients = [dict(row) for row in cursor.fetchall()]
+        if version == self._clients_version:
+            self._clients_cache[key] = clients
+        return list(clients)
 
     def get_client(self, client_id: int) -> Optional[Dict]:
         """
@@ -116,6 +143,7 @@ class ClientManager:
         query = f'UPDATE clients SET {", ".join(updates)} WHERE id = ?'
         cursor.execute(query, values)
         conn.commit()
+        self._invalidate_clients()
         return cursor.rowcount > 0
 
     def delete_client(self, client_id: int) -> bool:
@@ -132,6 +160,7 @@ class ClientManager:
         cursor = conn.cursor()
         cursor.execute('DELETE FROM clients WHERE id = ?', (client_id,))
         conn.commit()
+        self._invalidate_clients()
         return cursor.rowcount > 0
 
     def get_client_count(self) -> int:
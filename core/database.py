@@ -30,7 +30,11 @@ class DatabaseManager:
         if self._conn is None:
             self._conn = sqlite3.connect(
                 self.db_path,
-                check_same_thread=False  # Allow sharing across threads
+                check_same_thread=False,  # Allow sharing across threads
+                # Prepared statement cache (LRU keyed by SQL text). All managers
+                # share this connection with 200+ distinct queries, more than
+                # the default 128, so keep them all compiled
+                cached_statements=512
             )
             self._conn.row_factory = sqlite3.Row  # Enable dict-like access
 
@@ -219,6 +223,10 @@ class DatabaseManager:
             CREATE INDEX IF NOT EXISTS idx_clients_name
             ON clients(name)
         ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_clients_role
+            ON clients(role, name)
+        ''')
 
         # ==================== Studio Flow Tables ====================
 
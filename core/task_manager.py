@@ -50,6 +50,9 @@ class TaskManager:
 
     def __init__(self):
         self.db = get_database()
+        # PERFORMANCE: Templates change only through this manager; cache the
+        # parsed list for the "New Project" dialog
+        self._templates_cache: Optional[List[Dict]] = None
         self._init_default_templates()
 
     # ===== DAILY TASKS =====
@@ -518,27 +521,20 @@ class TaskManager:
 
         today = datetime.now().strftime('%Y-%m-%d')
 
-        # Daily task stats for today
+        # PERFORMANCE: One statement for all counters (dashboard refresh path)
         cursor.execute('''
-            SELECT COUNT(*) as total, SUM(CASE WHEN completed = 1 THEN 1 ELSE 0 END) as completed
-            FROM daily_tasks WHERE scheduled_date = ?
-        ''', (today,))
-        daily = cursor.fetchone()
-
-        # Project stats
-        cursor.execute('SELECT COUNT(*) FROM projects WHERE status = ?', ('active',))
-        active_projects = cursor.fetchone()[0]
-
-        # Overdue tasks
-        cursor.execute('''
-            SELECT COUNT(*) FROM project_tasks
-            WHERE due_date < ? AND completed = 0 AND due_date IS NOT NULL
-        ''', (today,))
-        overdue = cursor.fetchone()[0]
+            SELECT
+                (SELECT COUNT(*) FROM daily_tasks WHERE scheduled_date = ?),
+                (SELECT COUNT(*) FROM daily_tasks WHERE scheduled_date = ? AND completed = 1),
+                (SELECT COUNT(*) FROM projects WHERE status = 'active'),
+                (SELECT COUNT(*) FROM project_tasks
+                 WHERE due_date < ? AND completed = 0 AND due_date IS NOT NULL)
+        ''', (today, today, today))
+        daily_total, daily_completed, active_projects, overdue = cursor.fetchone()
 
         return {
-            'daily_total': daily[0] or 0,
-            'daily_completed': daily[1] or 0,
+            'daily_total': daily_total,
+            'daily_completed': daily_completed,
             'active_projects': active_projects,
             'overdue_tasks': overdue
         }
@@ -810,6 +806,7 @@ class TaskManager:
             VALUES (?, ?, ?)
         ''', (name, description, tasks_json))
         conn.commit()
+        self._templates_cache = None
         return cursor.lastrowid
 
     def get_project_templates(self) -> List[Dict]:
@@ -819,6 +816,9 @@ class TaskManager:
         Returns:
             List of template dicts with parsed tasks.
         """
+        if self._templates_cache is not None:
+            return list(self._templates_cache)
+
         conn = self.db._get_connection()
         cursor = conn.cursor()
         cursor.execute('SELECT * FROM project_templates ORDER BY name')
@@ -827,7 +827,8 @@ class TaskManager:
             template = dict(row)
             template['tasks'] = json.loads(template['tasks_json'])
             templates.append(template)
-        return templates
+        self._templates_cache = templates
+        return list(templates)
 
     def get_project_template(self, template_id: int) -> Optional[Dict]:
         """
@@ -899,6 +900,7 @@ class TaskManager:
         cursor = conn.cursor()
         cursor.execute('DELETE FROM project_templates WHERE id = ?', (template_id,))
         conn.commit()
+        self._templates_cache = None
         return cursor.rowcount > 0
 
     # ===== FILTERS & SEARCH =====
@@ -1014,6 +1016,28 @@ class TaskManager:
         cursor.execute(sql, params)
         return [dict(row) for row in cursor.fetchall()]
 
+    def get_focus_stats_by_date(self, start_date: str, end_date: str) -> Dict[str, Dict]:
+        """
+        Get completed focus time per day for a date range in one query.
+
+        Returns:
+            Dict mapping 'YYYY-MM-DD' to {'minutes', 'sessions'}; days
+            without completed sessions are omitted.
+        """
+        conn = self.db._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT DATE(started_at) as date, COUNT(*) as sessions,
+                   COALESCE(SUM(duration), 0) as total_duration
+            FROM focus_sessions
+            WHERE completed = 1 AND DATE(started_at) BETWEEN ? AND ?
+            GROUP BY DATE(started_at)
+        ''', (start_date, end_date))
+        return {
+            row[0]: {'minutes': row[2] // 60, 'sessions': row[1]}
+            for row in cursor.fetchall()
+        }
+
     # ===== PRODUCTIVITY STATS =====
 
     def get_completion_stats_by_date(self, start_date: str, end_date: str) -> List[Dict]:
@@ -1043,6 +1067,30 @@ class TaskManager:
         ''')
         return [{'context': row[0], 'count': row[1], 'total_time': row[2]} for row in cursor.fetchall()]
 
+    def get_data_version(self) -> int:
+        """
+        Get a counter that changes whenever the database is written.
+
+        Uses the connection's total_changes, so it covers every manager
+        sharing the connection; equal values mean no rows changed.
+        """
+        return self.db._get_connection().total_changes
+
+    def get_dashboard_snapshot(self, start_date: str, end_date: str) -> Dict:
+        """
+        Get all productivity dashboard data for a date range.
+
+        Returns:
+            Dict with 'stats', 'by_date', 'by_context' and 'focus_by_date'
+            (see the matching get_* methods).
+        """
+        return {
+            'stats': self.get_completion_stats(),
+            'by_date': self.get_completion_stats_by_date(start_date, end_date),
+            'by_context': self.get_completion_stats_by_context(),
+            'focus_by_date': self.get_focus_stats_by_date(start_date, end_date),
+        }
+
     def get_most_productive_day(self) -> str:
         """Get the day of week with most completions."""
         conn = self.db._get_connection()
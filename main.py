@@ -51,8 +51,11 @@ def main():
     def _deferred_init():
         """Initialize heavy components after UI is visible."""
         # Initialize pygame mixer (blocking operation)
+        # A 2048-frame buffer avoids underruns/popping next to other audio
+        # apps; latency is irrelevant for file playback
         import pygame
-        pygame.mixer.init()
+        if not pygame.mixer.get_init():
+            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=2048)
         app.player._pygame_ready = True
 
         # Configure ffmpeg (only needed for format conversion)
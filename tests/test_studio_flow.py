@@ -180,6 +180,16 @@ class TestProjectTemplates(unittest.TestCase):
         self.assertIsInstance(templates, list)
         print(f"[OK] Retrieved {len(templates)} project templates")
 
+    def test_template_cache_invalidation(self):
+        """Test the cached template list picks up new and deleted templates."""
+        before = len(self.tm.get_project_templates())
+        template_id = self.tm.create_project_template('Cache Test Template', 'Temp', [])
+        self.assertEqual(len(self.tm.get_project_templates()), before + 1)
+
+        self.tm.delete_project_template(template_id)
+        self.assertEqual(len(self.tm.get_project_templates()), before)
+        print("[OK] Template cache follows create/delete")
+
     def test_create_from_template(self):
         """Test creating project from template."""
         templates = self.tm.get_project_templates()
@@ -293,6 +303,23 @@ class TestFocusSessions(unittest.TestCase):
         self.assertIsInstance(sessions, list)
         print(f"[OK] Retrieved {len(sessions)} focus sessions for {self.today}")
 
+    def test_focus_stats_by_date(self):
+        """Test per-day focus aggregates match the raw sessions."""
+        task_id = self.tm.add_daily_task({
+            'title': 'Focus Stats Task',
+            'scheduled_date': self.today
+        })
+        session_id = self.tm.start_focus_session(task_id, duration=1500)
+        self.tm.complete_focus_session(session_id)
+        self.tm.start_focus_session(task_id, duration=900)  # Not completed
+
+        stats = self.tm.get_focus_stats_by_date(self.today, self.today)
+        sessions = [s for s in self.tm.get_focus_sessions(date=self.today) if s['completed']]
+        self.assertEqual(stats[self.today]['sessions'], len(sessions))
+        self.assertEqual(stats[self.today]['minutes'],
+                         sum(s['duration'] for s in sessions) // 60)
+        print(f"[OK] Focus stats for {self.today}: {stats[self.today]}")
+
 
 class TestProductivityStats(unittest.TestCase):
     """Test productivity statistics (Phase 21.2)."""
@@ -320,6 +347,23 @@ class TestProductivityStats(unittest.TestCase):
         for s in stats:
             print(f"  - {s.get('context', 'None')}: {s.get('count', 0)} tasks")
 
+    def test_data_version_changes_on_write(self):
+        """Test the data version moves on writes and holds on reads."""
+        before = self.tm.get_data_version()
+        self.tm.get_completion_stats()
+        self.assertEqual(self.tm.get_data_version(), before)
+
+        task_id = self.tm.add_daily_task({
+            'title': 'Version Task',
+            'scheduled_date': datetime.now().strftime('%Y-%m-%d')
+        })
+        after_add = self.tm.get_data_version()
+        self.assertNotEqual(after_add, before)
+
+        self.tm.toggle_daily_task(task_id)
+        self.assertNotEqual(self.tm.get_data_version(), after_add)
+        print("[OK] Data version tracks writes")
+
     def test_overall_stats(self):
         """Test getting overall completion stats."""
         stats = self.tm.get_completion_stats()
@@ -495,6 +539,76 @@ class TestDatabaseSchema(unittest.TestCase):
         print(f"[OK] project_tasks has time_spent column")
 
 
+class TestClientCardPool(unittest.TestCase):
+    """Test the virtualized Network card pool."""
+
+    def setUp(self):
+        try:
+            import tkinter as tk
+            import customtkinter  # noqa: F401
+            from ui.network_card import CardPool, ClientCard, ClientListRow
+        except ImportError:
+            self.skipTest("customtkinter or Pillow not installed")
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            self.skipTest("no display available")
+        self.addCleanup(self.root.destroy)
+        self.root.geometry("800x400")
+
+        self.CardPool = CardPool
+        self.ClientCard = ClientCard
+        self.ClientListRow = ClientListRow
+        self.viewport = tk.Canvas(self.root, height=400, highlightthickness=0)
+        self.viewport.pack(fill="both", expand=True)
+        self.container = tk.Frame(self.viewport)
+        self.viewport.create_window(0, 0, window=self.container, anchor="nw", width=800)
+        self.clients = [
+            {'id': i, 'name': f'Client {i}', 'role': 'Artist', 'email': f'client{i}@example.com',
+             'phone': '555-0100', 'notes': 'Note', 'instagram': '', 'twitter': '', 'website': ''}
+            for i in range(50)
+        ]
+
+    def _build(self, factory, item_height, gap, columns=1):
+        pool = self.CardPool(self.container, self.viewport, factory, item_height=item_height, gap=gap)
+        pool.set_items(self.clients, columns=columns)
+        self.root.update()
+        pool.update_visible()
+        self.root.update()
+        return pool
+
+    def test_card_pool_places_visible_cards(self):
+        """Cards are placed in slots tall enough for their content."""
+        item_height = self.ClientCard.natural_height(self.container) + 8
+        pool = self._build(self.ClientCard, item_height=item_height, gap=4, columns=3)
+
+        self.assertTrue(pool._active)
+        self.assertLess(len(pool._active), len(self.clients))
+        for idx, card in pool._active.items():
+            slot = card.master
+            info = slot.place_info()
+            self.assertEqual(int(info['y']), (idx // 3) * item_height + 4)
+            self.assertEqual(slot.winfo_height(), item_height - 8)
+            self.assertLessEqual(card.winfo_reqheight(), slot.winfo_height())
+        print(f"[OK] Card pool placed {len(pool._active)} of {len(self.clients)} cards")
+
+    def test_list_pool_recycles_rows(self):
+        """Rebinding to a new list reuses the existing rows."""
+        pool = self._build(self.ClientListRow, item_height=self.ClientListRow.natural_height(self.container) + 4, gap=2)
+        rows = set(map(id, pool._active.values()))
+
+        self.clients = list(reversed(self.clients))
+        pool.set_items(self.clients)
+        self.root.update()
+
+        self.assertEqual(set(map(id, pool._active.values())), rows)
+        for idx, row in pool._active.items():
+            self.assertEqual(row.client['id'], self.clients[idx]['id'])
+        pool.clear()
+        self.assertFalse(pool._active)
+        print("[OK] List pool recycled rows on rebind")
+
+
 def run_all_tests():
     """Run all tests and print summary."""
     print("=" * 60)
@@ -518,6 +632,7 @@ def run_all_tests():
         TestSampleLinking,
         TestRecurringTasks,
         TestDatabaseSchema,
+        TestClientCardPool,
     ]
 
     for test_class in test_classes:
@@ -171,9 +171,9 @@ class FocusModeWindow(ctk.CTkToplevel):
     def _update_session_count(self):
         """Update the session count display."""
         today = datetime.now().strftime('%Y-%m-%d')
-        sessions = self.task_manager.get_focus_sessions(date=today)
-        completed = sum(1 for s in sessions if s.get('completed'))
-        total_minutes = sum(s.get('duration', 0) for s in sessions if s.get('completed')) // 60
+        focus_today = self.task_manager.get_focus_stats_by_date(today, today).get(today, {})
+        completed = focus_today.get('sessions', 0)
+        total_minutes = focus_today.get('minutes', 0)
         self.sessions_label.configure(
             text=f"Today: {completed} sessions completed ({total_minutes} min focused)"
         )
@@ -9,7 +9,7 @@ from PIL import Image, ImageTk
 import pygame
 from collections import deque
 from typing import Optional, List, Dict, Callable
-from ui.theme import COLORS, SPACING, SIZING, FONTS
+from ui.theme import COLORS, SPACING, SIZING, FONTS, FontCache
 from core.scanner import LibraryScanner
 from core.waveform import generate_waveform_image
 from core.database import get_database
@@ -23,25 +23,6 @@ except ImportError:
     ANALYZER_AVAILABLE = False
 
 
-# =============================================================================
-# PERFORMANCE: Shared font cache to avoid repeated CTkFont instantiation
-# =============================================================================
-class FontCache:
-    """Cache for CTkFont objects to avoid repeated instantiation."""
-    _cache: Dict[tuple, ctk.CTkFont] = {}
-
-    @classmethod
-    def get(cls, size: int = 12, weight: str = "normal", family: str = None) -> ctk.CTkFont:
-        """Get or create a cached font."""
-        key = (size, weight, family)
-        if key not in cls._cache:
-            if family:
-                cls._cache[key] = ctk.CTkFont(family=family, size=size, weight=weight)
-            else:
-                cls._cache[key] = ctk.CTkFont(size=size, weight=weight)
-        return cls._cache[key]
-
-
 # =============================================================================
 # PERFORMANCE: Waveform loading queue with concurrency control
 # =============================================================================
@@ -757,6 +738,7 @@ class SampleList(ctk.CTkFrame):
         self.config_manager = config_manager  # For persisting sort preferences
         self.sample_rows = []
         self.all_samples = []  # All samples in current folder
+        self._samples_by_path: Dict[str, dict] = {}  # path -> sample dict in all_samples
         self.filtered_samples = []  # Samples after search filter
         self.current_playing_row = None
         self.current_path = None
@@ -1089,12 +1071,21 @@ class SampleList(ctk.CTkFrame):
         self._build_folder_breadcrumb(folder_path)
 
         # Scan folder and store samples (non-recursive - only files in this folder)
-        self.all_samples = LibraryScanner.scan_folder(folder_path)
+        self._set_all_samples(LibraryScanner.scan_folder(folder_path))
         self.search_query = ""
 
         # Apply filter and display
         self._refresh_display()
 
+    def _set_all_samples(self, samples: list):
+        """Replace the source sample list and rebuild the path lookup.
+
+        PERFORMANCE: _samples_by_path gives O(1) access to source samples
+        for favorite removal and analysis updates.
+        """
+        self.all_samples = samples
+        self._samples_by_path = {s['path']: s for s in samples}
+
     def filter_samples(self, query: str, global_search: bool = False):
         """Filter displayed samples by search query.
 
@@ -1114,7 +1105,7 @@ class SampleList(ctk.CTkFrame):
 
             # Get results from database
             db = get_database()
-            self.all_samples = db.search_samples(self.search_query)
+            self._set_all_samples(db.search_samples(self.search_query))
 
             # Update breadcrumb for global search
             self._set_breadcrumb_text(f"\U0001f50d Global Search: \"{query.strip()}\"")
@@ -1413,8 +1404,10 @@ class SampleList(ctk.CTkFrame):
         """Handle favorite change from a sample row."""
         # If in favorites view and sample was unfavorited, remove it from view
         if self.is_favorites_view and not is_favorite:
-            # Remove from filtered_samples and refresh
-            self.all_samples = [s for s in self.all_samples if s['path'] != sample['path']]
+            # PERFORMANCE: O(1) lookup via _samples_by_path, remove in place
+            removed = self._samples_by_path.pop(sample['path'], None)
+            if removed is not None:
+                self.all_samples.remove(removed)
             self._refresh_display()
 
         # Notify callback
@@ -1456,12 +1449,10 @@ class SampleList(ctk.CTkFrame):
         detected_key = result.get('key', '')
 
         # Update source data in all_samples (so refresh doesn't lose it)
-        sample_path = row.sample['path']
-        for sample in self.all_samples:
-            if sample['path'] == sample_path:
-                sample['detected_bpm'] = detected_bpm
-                sample['detected_key'] = detected_key
-                break
+        sample = self._samples_by_path.get(row.sample['path'])
+        if sample is not None:
+            sample['detected_bpm'] = detected_bpm
+            sample['detected_key'] = detected_key
 
         # Update row display
         row.update_analysis_result(detected_bpm, detected_key)
@@ -1502,12 +1493,10 @@ class SampleList(ctk.CTkFrame):
                 self.analyze_btn.configure(text="Analyze All", state="normal")
                 # Update all_samples with detected values from results
                 for result in results:
-                    if result.get('path'):
-                        for sample in self.all_samples:
-                            if sample['path'] == result['path']:
-                                sample['detected_bpm'] = result.get('bpm', '')
-                                sample['detected_key'] = result.get('key', '')
-                                break
+                    sample = self._samples_by_path.get(result.get('path'))
+                    if sample is not None:
+                        sample['detected_bpm'] = result.get('bpm', '')
+                        sample['detected_key'] = result.get('key', '')
                 self._refresh_display()
             self.after(0, finish)
 
@@ -1530,7 +1519,7 @@ class SampleList(ctk.CTkFrame):
 
         # Get favorites from database
         db = get_database()
-        self.all_samples = db.get_favorites()
+        self._set_all_samples(db.get_favorites())
         self.search_query = ""
 
         # Apply filter and display
@@ -1551,7 +1540,7 @@ class SampleList(ctk.CTkFrame):
         self._set_breadcrumb_text(f"\u25A1 {collection_name}")
 
         # Get collection samples
-        self.all_samples = db.get_collection_samples(collection_id)
+        self._set_all_samples(db.get_collection_samples(collection_id))
         self.search_query = ""
 
         # Apply filter and display
@@ -1569,7 +1558,7 @@ class SampleList(ctk.CTkFrame):
 
         # Get recent samples from database
         db = get_database()
-        self.all_samples = db.get_recent_samples()
+        self._set_all_samples(db.get_recent_samples())
         self.search_query = ""
 
         # Apply filter and display
@@ -1584,7 +1573,7 @@ class SampleList(ctk.CTkFrame):
             row.destroy()
         self.sample_rows = []
         self._sample_to_row_map.clear()  # PERFORMANCE: Clear the lookup map
-        self.all_samples = []
+        self._set_all_samples([])
         self.filtered_samples = []
         self.current_playing_row = None
         self.is_favorites_view = False
@@ -1603,23 +1592,18 @@ class SampleList(ctk.CTkFrame):
         """Update visual state to show which sample is playing.
 
         PERFORMANCE: Uses _sample_to_row_map for O(1) lookup instead of O(n) iteration.
+        The map covers every rendered row in both the direct and virtualized
+        paths, so a miss means the row is simply not on screen.
         """
         # Stop current playing row if different
         if self.current_playing_row and self.current_playing_row.sample['path'] != sample_path:
             self.current_playing_row.set_playing(False)
+            self.current_playing_row = None
 
-        # PERFORMANCE: O(1) lookup using map instead of O(n) loop
-        if sample_path in self._sample_to_row_map:
-            row = self._sample_to_row_map[sample_path]
+        row = self._sample_to_row_map.get(sample_path)
+        if row is not None:
             row.set_playing(True, sync_active=sync_active)
             self.current_playing_row = row
-        else:
-            # Fallback for non-virtualized case or row not visible
-            for row in self.sample_rows:
-                if row.sample['path'] == sample_path:
-                    row.set_playing(True, sync_active=sync_active)
-                    self.current_playing_row = row
-                    break
 
     def update_progress(self, percentage: float):
         """Update the progress needle on the currently playing sample row.
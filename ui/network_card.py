@@ -1,9 +1,12 @@
 """Network Card component for ProducerOS - Premium card display for contacts."""
 
 import os
+import tkinter as tk
+from bisect import bisect_right
+from functools import partial
 import customtkinter as ctk
-from PIL import Image
-from ui.theme import COLORS, SPACING
+from PIL import Image, ImageTk
+from ui.theme import COLORS, SPACING, FontCache
 from core.client_manager import ClientManager
 
 # Role color mapping for badges
@@ -12,51 +15,172 @@ ROLE_COLORS = {
     'Artist': '#EC4899',      # Pink
 }
 
-# Load Instagram logo - invert to white on transparent for dark UI
-_INSTAGRAM_LOGO = None
-def _get_instagram_logo():
-    global _INSTAGRAM_LOGO
-    if _INSTAGRAM_LOGO is None:
-        logo_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'IMAGE', 'instagram_logo.jpg')
-        if os.path.exists(logo_path):
-            img = Image.open(logo_path).convert('RGBA')
-            data = img.getdata()
-            new_data = []
-            for pixel in data:
-                # Black/dark pixels -> white, white/light pixels -> transparent
-                brightness = (pixel[0] + pixel[1] + pixel[2]) / 3
-                if brightness > 200:  # Light/white -> transparent
-                    new_data.append((0, 0, 0, 0))
-                else:  # Dark/black -> white
-                    new_data.append((255, 255, 255, 255))
-            img.putdata(new_data)
-            _INSTAGRAM_LOGO = ctk.CTkImage(light_image=img, dark_image=img, size=(16, 16))
-    return _INSTAGRAM_LOGO
-
-# Load Twitter/X logo - make black background transparent, keep white X
-_TWITTER_LOGO = None
-def _get_twitter_logo():
-    global _TWITTER_LOGO
-    if _TWITTER_LOGO is None:
-        logo_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'IMAGE', 'twitter_logo.png')
-        if os.path.exists(logo_path):
-            img = Image.open(logo_path).convert('RGBA')
-            data = img.getdata()
-            new_data = []
-            for pixel in data:
-                # Black/dark pixels -> transparent, white/light pixels -> keep white
-                brightness = (pixel[0] + pixel[1] + pixel[2]) / 3
-                if brightness < 50:  # Dark/black -> transparent
-                    new_data.append((0, 0, 0, 0))
-                else:  # Light/white -> keep white
-                    new_data.append((255, 255, 255, 255))
-            img.putdata(new_data)
-            _TWITTER_LOGO = ctk.CTkImage(light_image=img, dark_image=img, size=(16, 16))
-    return _TWITTER_LOGO
+# PERFORMANCE: Pre-built badge style per role, so a card does one dict hit
+_ROLE_BADGE_KWARGS = {
+    role: {'fg_color': color, 'text_color': '#ffffff'}
+    for role, color in ROLE_COLORS.items()
+}
+_DEFAULT_BADGE_KWARGS = _ROLE_BADGE_KWARGS['Producer']
+
+_IMAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'IMAGE')
+# Logos display at 16x16; keep 2x pixels so HiDPI scaling stays crisp
+_LOGO_PIXELS = 32
+
+
+def _load_recolored_logo(logo_path: str, recolor):
+    """Load a recolored logo, reusing a PNG cache stored next to the source.
+
+    PERFORMANCE: The cache is keyed by mtime so warm starts skip the
+    decode + recolor pass entirely.
+    """
+    cache_path = f"{logo_path}.recolor{_LOGO_PIXELS}.png"
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(logo_path):
+        try:
+            return Image.open(cache_path)
+        except Exception:
+            pass
+
+    # PERFORMANCE: Shrink to display size before recoloring. draft() lets
+    # libjpeg decode JPEGs at reduced scale (no-op for other formats).
+    img = Image.open(logo_path)
+    img.draft('RGB', (_LOGO_PIXELS, _LOGO_PIXELS))
+    if img.mode != 'RGBA':  # Skip a full-image copy when already RGBA
+        img = img.convert('RGBA')
+    img = img.resize((_LOGO_PIXELS, _LOGO_PIXELS), Image.LANCZOS)
+    img = recolor(img)
+    try:
+        img.save(cache_path, 'PNG', optimize=False)
+    except Exception:
+        pass  # Read-only install dir - just skip caching
+    return img
+
+
+# PERFORMANCE: Brightness -> alpha lookup tables applied by libImaging in C
+_INSTAGRAM_ALPHA_LUT = [255 if v <= 200 else 0 for v in range(256)]
+_TWITTER_ALPHA_LUT = [255 if v >= 50 else 0 for v in range(256)]
+
+
+def _white_with_alpha(img, alpha_lut):
+    """Build a white RGBA image whose alpha is the image brightness mapped through a LUT."""
+    mask = img.convert('L').point(alpha_lut)
+    white = Image.new('L', img.size, 255)
+    return Image.merge('RGBA', (white, white, white, mask))
+
+
+def _recolor_instagram(img):
+    """Black/dark pixels -> white, white/light pixels -> transparent."""
+    return _white_with_alpha(img, _INSTAGRAM_ALPHA_LUT)
+
+
+def _recolor_twitter(img):
+    """Black/dark pixels -> transparent, white/light pixels -> keep white."""
+    return _white_with_alpha(img, _TWITTER_ALPHA_LUT)
+
+
+def _build_logo(filename: str, recolor):
+    """Build a 16x16 CTkImage for a social logo, or None if the file is missing."""
+    logo_path = os.path.join(_IMAGE_DIR, filename)
+    if not os.path.exists(logo_path):
+        return None
+    img = _load_recolored_logo(logo_path, recolor)
+    return ctk.CTkImage(light_image=img, dark_image=img, size=(16, 16))
+
+
+# PERFORMANCE: Logos are built once at import (CTkImage needs no Tk root until
+# it is rendered), so card construction just references the constants.
+# Instagram: inverted to white on transparent for dark UI
+INSTAGRAM_LOGO = _build_logo('instagram_logo.jpg', _recolor_instagram)
+# Twitter/X: black background made transparent, white X kept
+TWITTER_LOGO = _build_logo('twitter_logo.png', _recolor_twitter)
+
+
+def _notes_preview(client: dict) -> str:
+    """Get the truncated notes preview for a client, memoized on the client dict."""
+    preview = client.get('_notes_preview')
+    if preview is None:
+        notes = client.get('notes') or ''
+        preview = notes[:50] + "..." if len(notes) > 50 else notes
+        client['_notes_preview'] = preview
+    return preview
+
+
+def _elide(text: str, font, max_width: int) -> str:
+    """Shorten text with a trailing ellipsis so it fits within max_width pixels.
+
+    Canvas text items have no clipping (their width option only wraps), so
+    list row columns are elided to their width instead.
+    """
+    if not text or font.measure(text) <= max_width:
+        return text or ""
+    # Binary search for the longest prefix that fits with the ellipsis
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if font.measure(text[:mid] + "\u2026") <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo].rstrip() + "\u2026"
+
+
+def prepare_clients(clients: list) -> list:
+    """Precompute per-client display data so binding a widget is pure configure.
+
+    Touches no Tk state, so it can run on a worker thread.
+    """
+    for client in clients:
+        _notes_preview(client)
+    return clients
+
+
+def _icon_enter(event):
+    """Show an icon label's hover color."""
+    label = event.widget.master  # CTkLabel owning the inner canvas/label
+    label.configure(fg_color=label._icon_hover_color)
+
+
+def _icon_leave(event):
+    """Restore an icon label's normal color."""
+    label = event.widget.master
+    label.configure(fg_color=label._icon_fg_color)
+
+
+def _icon_click(event):
+    """Run an icon label's command."""
+    event.widget.master._icon_command()
+
+
+def _icon_button(parent, command, fg_color, hover_color, **kwargs):
+    """Create a lightweight clickable icon: a CTkLabel with click/hover bindings.
+
+    PERFORMANCE: Avoids CTkButton's extra canvas and hover state machine for
+    small static icons. The handlers are shared module functions reading
+    the colors and command stored on the label, so no closures per icon.
+    """
+    label = ctk.CTkLabel(parent, fg_color=fg_color, cursor="hand2", **kwargs)
+    label._icon_fg_color = fg_color
+    label._icon_hover_color = hover_color
+    label._icon_command = command
+    label.bind("<Enter>", _icon_enter)
+    label.bind("<Leave>", _icon_leave)
+    label.bind("<Button-1>", _icon_click)
+    return label
+
+
+# A client with every optional field set, for measuring a card's full height
+_PROBE_CLIENT = {
+    'id': None, 'name': "Probe", 'role': "Producer",
+    'email': "probe@example.com", 'phone': "000", 'notes': "x" * 60,
+    'instagram': "probe", 'twitter': "probe", 'website': "probe",
+}
 
 
 class ClientCard(ctk.CTkFrame):
-    """A premium card displaying contact information with social links and role badge."""
+    """A premium card displaying contact information with social links and role badge.
+
+    Widgets are built once; update_data() rebinds the card to another client
+    so pooled cards can be recycled while scrolling.
+    """
 
     def __init__(self, parent, client: dict, on_click=None, on_edit=None, on_delete=None, **kwargs):
         super().__init__(
@@ -72,12 +196,27 @@ class ClientCard(ctk.CTkFrame):
         self.on_click = on_click
         self.on_edit = on_edit
         self.on_delete = on_delete
+        self._hover_state = False
 
         self._build_ui()
+        self._refresh()
         self._bind_hover()
 
+    @classmethod
+    def natural_height(cls, parent) -> int:
+        """Height in screen pixels of a card showing every field.
+
+        Measured rather than computed, so pool slots follow the CTk widget
+        scaling and the installed fonts.
+        """
+        probe = cls(parent, _PROBE_CLIENT)
+        probe.update_idletasks()
+        height = probe.winfo_reqheight()
+        probe.destroy()
+        return height
+
     def _build_ui(self):
-        """Build the card UI."""
+        """Build the card widgets. Content is filled in by _refresh()."""
         # Main content padding
         content = ctk.CTkFrame(self, fg_color="transparent")
         content.pack(fill="both", expand=True, padx=SPACING['md'], pady=SPACING['md'])
@@ -87,135 +226,163 @@ class ClientCard(ctk.CTkFrame):
         header_frame.pack(fill="x", pady=(0, SPACING['sm']))
 
         # Name (large, bold)
-        name_label = ctk.CTkLabel(
+        self._name_label = ctk.CTkLabel(
             header_frame,
-            text=self.client.get('name', 'Unknown'),
-            font=ctk.CTkFont(family="Inter", size=16, weight="bold"),
+            text="",
+            font=FontCache.get(16, weight="bold", family="Inter"),
             text_color=COLORS['fg'],
             anchor="w"
         )
-        name_label.pack(side="left")
+        self._name_label.pack(side="left")
 
         # Role badge
-        role = self.client.get('role', 'Producer')
-        role_color = ROLE_COLORS.get(role, ROLE_COLORS['Producer'])
-        role_badge = ctk.CTkLabel(
+        self._role_badge = ctk.CTkLabel(
             header_frame,
-            text=role,
-            font=ctk.CTkFont(family="Inter", size=10, weight="bold"),
-            text_color="#ffffff",
-            fg_color=role_color,
+            text="",
+            font=FontCache.get(10, weight="bold", family="Inter"),
             corner_radius=4,
             padx=6,
-            pady=2
+            pady=2,
+            **_DEFAULT_BADGE_KWARGS
         )
-        role_badge.pack(side="right")
+        self._role_badge.pack(side="right")
 
         # Contact info section
         contact_frame = ctk.CTkFrame(content, fg_color="transparent")
         contact_frame.pack(fill="x", pady=(0, SPACING['sm']))
+        contact_frame.grid_columnconfigure(0, weight=1)
 
-        # Email (if available)
-        if self.client.get('email'):
-            self._create_info_row(contact_frame, "\u2709", self.client['email'])  # Envelope icon
-
-        # Phone (if available)
-        if self.client.get('phone'):
-            self._create_info_row(contact_frame, "\u260E", self.client['phone'])  # Phone icon
+        self._email_label = self._create_info_row(contact_frame, "\u2709", 0)  # Envelope icon
+        self._phone_label = self._create_info_row(contact_frame, "\u260E", 1)  # Phone icon
 
         # Social links row
         socials_frame = ctk.CTkFrame(content, fg_color="transparent")
         socials_frame.pack(fill="x", pady=(SPACING['xs'], 0))
+        socials_frame.grid_columnconfigure(3, weight=1)
 
         # Instagram button with real logo
-        if self.client.get('instagram'):
-            ig_logo = _get_instagram_logo()
-            ig_btn = ctk.CTkButton(
-                socials_frame,
-                text="" if ig_logo else "\u25CE",
-                image=ig_logo,
-                font=ctk.CTkFont(size=16),
-                fg_color=COLORS['bg_hover'],
-                hover_color="#E1306C",
-                width=32,
-                height=28,
-                corner_radius=6,
-                text_color=COLORS['fg'],
-                command=lambda: self._open_social('instagram', self.client['instagram'])
-            )
-            ig_btn.pack(side="left", padx=(0, SPACING['xs']))
+        ig_logo = INSTAGRAM_LOGO
+        self._ig_btn = _icon_button(
+            socials_frame,
+            partial(self._open_client_social, 'instagram'),
+            text="" if ig_logo else "\u25CE",
+            image=ig_logo,
+            font=FontCache.get(16),
+            fg_color=COLORS['bg_hover'],
+            hover_color="#E1306C",
+            width=32,
+            height=28,
+            corner_radius=6,
+            text_color=COLORS['fg']
+        )
+        self._ig_btn.grid(row=0, column=0, padx=(0, SPACING['xs']))
 
         # Twitter/X button with real logo
-        if self.client.get('twitter'):
-            tw_logo = _get_twitter_logo()
-            tw_btn = ctk.CTkButton(
-                socials_frame,
-                text="" if tw_logo else "\u2573",
-                image=tw_logo,
-                font=ctk.CTkFont(size=14, weight="bold"),
-                fg_color=COLORS['bg_hover'],
-                hover_color="#000000",  # X black
-                width=32,
-                height=28,
-                corner_radius=6,
-                text_color=COLORS['fg'],
-                command=lambda: self._open_social('twitter', self.client['twitter'])
-            )
-            tw_btn.pack(side="left", padx=(0, SPACING['xs']))
+        tw_logo = TWITTER_LOGO
+        self._tw_btn = _icon_button(
+            socials_frame,
+            partial(self._open_client_social, 'twitter'),
+            text="" if tw_logo else "\u2573",
+            image=tw_logo,
+            font=FontCache.get(14, weight="bold"),
+            fg_color=COLORS['bg_hover'],
+            hover_color="#000000",  # X black
+            width=32,
+            height=28,
+            corner_radius=6,
+            text_color=COLORS['fg']
+        )
+        self._tw_btn.grid(row=0, column=1, padx=(0, SPACING['xs']))
 
         # Website button
-        if self.client.get('website'):
-            web_btn = ctk.CTkButton(
-                socials_frame,
-                text="\u2197",  # Arrow icon for external link
-                font=ctk.CTkFont(size=14),
-                fg_color=COLORS['bg_hover'],
-                hover_color=COLORS['accent'],
-                width=36,
-                height=28,
-                corner_radius=6,
-                text_color=COLORS['fg'],
-                command=lambda: self._open_social('website', self.client['website'])
-            )
-            web_btn.pack(side="left", padx=(0, SPACING['xs']))
+        self._web_btn = _icon_button(
+            socials_frame,
+            partial(self._open_client_social, 'website'),
+            text="\u2197",  # Arrow icon for external link
+            font=FontCache.get(14),
+            fg_color=COLORS['bg_hover'],
+            hover_color=COLORS['accent'],
+            width=36,
+            height=28,
+            corner_radius=6,
+            text_color=COLORS['fg']
+        )
+        self._web_btn.grid(row=0, column=2, padx=(0, SPACING['xs']))
 
         # Edit button (right side)
-        edit_btn = ctk.CTkButton(
+        edit_btn = _icon_button(
             socials_frame,
+            self._on_edit_click,
             text="\u270E",  # Pencil icon
-            font=ctk.CTkFont(size=12),
+            font=FontCache.get(12),
             fg_color="transparent",
             hover_color=COLORS['bg_hover'],
             width=28,
             height=28,
             corner_radius=6,
+            text_color=COLORS['fg_dim']
+        )
+        edit_btn.grid(row=0, column=4, sticky="e")
+
+        # Notes preview (truncated) - packed only when the client has notes
+        self._notes_label = ctk.CTkLabel(
+            content,
+            text="",
+            font=FontCache.get(11, family="Inter"),
             text_color=COLORS['fg_dim'],
-            command=self._on_edit_click
+            anchor="w",
+            wraplength=200
         )
-        edit_btn.pack(side="right")
+
+    def _refresh(self):
+        """Fill the existing widgets from self.client (no widgets are created)."""
+        # Snapshot client fields once instead of repeated dict lookups
+        c = self.client
+        role = c.get('role', 'Producer')
+        email = c.get('email')
+        phone = c.get('phone')
+        notes = _notes_preview(c)
+
+        self._name_label.configure(text=c.get('name', 'Unknown'))
+        self._role_badge.configure(text=role, **_ROLE_BADGE_KWARGS.get(role, _DEFAULT_BADGE_KWARGS))
+
+        # Email / phone rows (if available)
+        for label, value in ((self._email_label, email), (self._phone_label, phone)):
+            if value:
+                label.configure(text=value)
+                label.master.grid()
+            else:
+                label.master.grid_remove()
+
+        # Social buttons (if available)
+        for btn, key in ((self._ig_btn, 'instagram'), (self._tw_btn, 'twitter'), (self._web_btn, 'website')):
+            if c.get(key):
+                btn.grid()
+            else:
+                btn.grid_remove()
 
         # Notes preview (if available, truncated)
-        if self.client.get('notes'):
-            notes_text = self.client['notes'][:50] + "..." if len(self.client['notes']) > 50 else self.client['notes']
-            notes_label = ctk.CTkLabel(
-                content,
-                text=notes_text,
-                font=ctk.CTkFont(family="Inter", size=11),
-                text_color=COLORS['fg_dim'],
-                anchor="w",
-                wraplength=200
-            )
-            notes_label.pack(fill="x", pady=(SPACING['sm'], 0))
+        if notes:
+            self._notes_label.configure(text=notes)
+            self._notes_label.pack(fill="x", pady=(SPACING['sm'], 0))
+        else:
+            self._notes_label.pack_forget()
+
+    def update_data(self, client: dict):
+        """Rebind this card to another client, reusing its widgets."""
+        self.client = client
+        self._on_leave(None)  # A recycled card may still be in hover state
+        self._refresh()
 
-    def _create_info_row(self, parent, icon: str, text: str):
-        """Create a row with icon and text."""
+    def _create_info_row(self, parent, icon: str, grid_row: int):
+        """Create a row with icon and text; returns the text label."""
         row = ctk.CTkFrame(parent, fg_color="transparent")
-        row.pack(fill="x", pady=2)
+        row.grid(row=grid_row, column=0, sticky="ew", pady=2)
 
         icon_label = ctk.CTkLabel(
             row,
             text=icon,
-            font=ctk.CTkFont(size=12),
+            font=FontCache.get(12),
             text_color=COLORS['fg_dim'],
             width=20
         )
@@ -223,12 +390,13 @@ class ClientCard(ctk.CTkFrame):
 
         text_label = ctk.CTkLabel(
             row,
-            text=text,
-            font=ctk.CTkFont(family="Inter", size=12),
+            text="",
+            font=FontCache.get(12, family="Inter"),
             text_color=COLORS['fg_secondary'],
             anchor="w"
         )
         text_label.pack(side="left", fill="x", expand=True)
+        return text_label
 
     def _bind_hover(self):
         """Bind hover effects."""
@@ -237,163 +405,254 @@ class ClientCard(ctk.CTkFrame):
 
     def _on_enter(self, event):
         """Handle mouse enter."""
+        # Skip the frame redraw when re-entering from a child widget
+        if self._hover_state:
+            return
+        self._hover_state = True
         self.configure(border_color=COLORS['accent'])
 
     def _on_leave(self, event):
         """Handle mouse leave."""
+        if not self._hover_state:
+            return
+        self._hover_state = False
         self.configure(border_color=COLORS['border'])
 
     def _open_social(self, platform: str, handle: str):
         """Open a social link."""
         ClientManager.open_social_link(platform, handle)
 
+    def _open_client_social(self, platform: str):
+        """Open the current client's link for a platform."""
+        handle = self.client.get(platform)
+        if handle:
+            self._open_social(platform, handle)
+
     def _on_edit_click(self):
         """Handle edit button click."""
         if self.on_edit:
             self.on_edit(self.client)
 
 
-class ClientListRow(ctk.CTkFrame):
-    """A row for list view display of a contact with role badge."""
+# PhotoImages for canvas-drawn rows, keyed by (logo, size) (created on first use - needs a Tk root)
+_ROW_ICONS = {}
+
+
+def _get_row_icon(logo, size: int):
+    """Get a size x size tk PhotoImage for a CTkImage logo, or None if the logo is missing."""
+    if logo is None:
+        return None
+    key = (id(logo), size)
+    icon = _ROW_ICONS.get(key)
+    if icon is None:
+        icon = ImageTk.PhotoImage(logo.cget('light_image').resize((size, size), Image.LANCZOS))
+        _ROW_ICONS[key] = icon
+    return icon
+
+
+class ClientListRow(tk.Canvas):
+    """A row for list view display of a contact with role badge.
+
+    PERFORMANCE: The row is drawn on a single canvas instead of ~10 CTk
+    widgets. Social/edit actions are hit regions dispatched from one
+    <Button-1> handler, and highlighted from one <Motion> handler.
+
+    Geometry and font sizes below are in CTk's unscaled units; the row
+    multiplies them by the widget scaling so it lines up with the CTk
+    list header on scaled displays.
+    """
+
+    HEIGHT = 48
+    # Column x positions - aligned with the list header in ClientsView
+    NAME_X = SPACING['md']
+    ROLE_X = NAME_X + 140 + SPACING['md']
+    EMAIL_X = ROLE_X + 60 + SPACING['sm'] * 2
+    PHONE_X = EMAIL_X + 200 + SPACING['sm'] * 2
+    ROLE_WIDTH = 60
+
+    @classmethod
+    def natural_height(cls, parent) -> int:
+        """Height of a row in screen pixels under parent's widget scaling."""
+        return round(cls.HEIGHT * ctk.ScalingTracker.get_widget_scaling(parent))
 
     def __init__(self, parent, client: dict, on_edit=None, on_delete=None, **kwargs):
+        self._scale = ctk.ScalingTracker.get_widget_scaling(parent)
         super().__init__(
             parent,
-            fg_color=COLORS['bg_card'],
-            corner_radius=4,
-            height=48,
+            bg=COLORS['bg_card'],
+            height=self._px(self.HEIGHT),
+            highlightthickness=0,
+            bd=0,
             **kwargs
         )
-        self.pack_propagate(False)
 
         self.client = client
         self.on_edit = on_edit
         self.on_delete = on_delete
+        self._hit_starts = []   # Sorted x0 of each action region (for bisect)
+        self._hit_regions = []  # (x0, x1, callback, rect item, fill, hover fill) in the same order
+        self._hover_region = None  # Hit region currently highlighted
+        self._hover_state = False
 
         self._build_ui()
         self._bind_hover()
+        self.bind("<Configure>", self._on_configure)
+        self.bind("<Button-1>", self._on_click)
+        self.bind("<Motion>", self._on_motion)
+
+    def _px(self, value: float) -> int:
+        """Scale an unscaled length to screen pixels."""
+        return round(value * self._scale)
 
     def _build_ui(self):
-        """Build the row UI."""
-        # Name column (flex)
-        name_label = ctk.CTkLabel(
-            self,
-            text=self.client.get('name', 'Unknown'),
-            font=ctk.CTkFont(family="Inter", size=13, weight="bold"),
-            text_color=COLORS['fg'],
-            anchor="w",
-            width=140
+        """Draw the row."""
+        # Snapshot client fields once instead of repeated dict lookups
+        c = self.client
+        name = c.get('name', 'Unknown')
+        role = c.get('role', 'Producer')
+        email = c.get('email', '-')
+        phone = c.get('phone', '-')
+        px = self._px
+
+        self.delete("all")
+        mid_y = px(self.HEIGHT) // 2
+
+        # Name column
+        name_font = FontCache.get(px(13), weight="bold", family="Inter")
+        self.create_text(
+            px(self.NAME_X), mid_y, text=_elide(name, name_font, px(140)), anchor="w",
+            font=name_font, fill=COLORS['fg']
         )
-        name_label.pack(side="left", padx=SPACING['md'], pady=SPACING['sm'])
 
         # Role badge (compact)
-        role = self.client.get('role', 'Producer')
-        role_color = ROLE_COLORS.get(role, ROLE_COLORS['Producer'])
-        role_badge = ctk.CTkLabel(
-            self,
-            text=role,
-            font=ctk.CTkFont(family="Inter", size=9, weight="bold"),
-            text_color="#ffffff",
-            fg_color=role_color,
-            corner_radius=3,
-            padx=4,
-            pady=1,
-            width=60
+        badge = _ROLE_BADGE_KWARGS.get(role, _DEFAULT_BADGE_KWARGS)
+        role_x = px(self.ROLE_X)
+        role_width = px(self.ROLE_WIDTH)
+        self.create_rectangle(
+            role_x, mid_y - px(9), role_x + role_width, mid_y + px(9),
+            fill=badge['fg_color'], outline=""
+        )
+        self.create_text(
+            role_x + role_width // 2, mid_y, text=role,
+            font=FontCache.get(px(9), weight="bold", family="Inter"), fill=badge['text_color']
         )
-        role_badge.pack(side="left", padx=(0, SPACING['sm']))
 
         # Email column
-        email_label = ctk.CTkLabel(
-            self,
-            text=self.client.get('email', '-'),
-            font=ctk.CTkFont(family="Inter", size=12),
-            text_color=COLORS['fg_secondary'],
-            anchor="w",
-            width=200
+        info_font = FontCache.get(px(12), family="Inter")
+        self.create_text(
+            px(self.EMAIL_X), mid_y, text=_elide(email, info_font, px(200)), anchor="w",
+            font=info_font, fill=COLORS['fg_secondary']
         )
-        email_label.pack(side="left", padx=SPACING['sm'])
 
         # Phone column
-        phone_label = ctk.CTkLabel(
-            self,
-            text=self.client.get('phone', '-'),
-            font=ctk.CTkFont(family="Inter", size=12),
-            text_color=COLORS['fg_secondary'],
-            anchor="w",
-            width=120
+        self.create_text(
+            px(self.PHONE_X), mid_y, text=_elide(phone, info_font, px(120)), anchor="w",
+            font=info_font, fill=COLORS['fg_secondary']
         )
-        phone_label.pack(side="left", padx=SPACING['sm'])
-
-        # Social buttons (right side)
-        socials_frame = ctk.CTkFrame(self, fg_color="transparent")
-        socials_frame.pack(side="right", padx=SPACING['md'])
-
-        # Instagram with real logo
-        if self.client.get('instagram'):
-            ig_logo = _get_instagram_logo()
-            ig_btn = ctk.CTkButton(
-                socials_frame,
-                text="" if ig_logo else "\u25CE",
-                image=ig_logo,
-                font=ctk.CTkFont(size=14),
-                fg_color=COLORS['bg_hover'],
-                hover_color="#E1306C",
-                width=28,
-                height=24,
-                corner_radius=4,
-                text_color=COLORS['fg'],
-                command=lambda: ClientManager.open_social_link('instagram', self.client['instagram'])
-            )
-            ig_btn.pack(side="left", padx=2)
-
-        # Twitter with real logo
-        if self.client.get('twitter'):
-            tw_logo = _get_twitter_logo()
-            tw_btn = ctk.CTkButton(
-                socials_frame,
-                text="" if tw_logo else "\u2573",
-                image=tw_logo,
-                font=ctk.CTkFont(size=12, weight="bold"),
-                fg_color=COLORS['bg_hover'],
-                hover_color="#000000",
-                width=28,
-                height=24,
-                corner_radius=4,
-                text_color=COLORS['fg'],
-                command=lambda: ClientManager.open_social_link('twitter', self.client['twitter'])
-            )
-            tw_btn.pack(side="left", padx=2)
-
-        # Website
-        if self.client.get('website'):
-            web_btn = ctk.CTkButton(
-                socials_frame,
-                text="\u2197",
-                font=ctk.CTkFont(size=12),
-                fg_color=COLORS['bg_hover'],
-                hover_color=COLORS['accent'],
-                width=32,
-                height=24,
-                corner_radius=4,
-                text_color=COLORS['fg'],
-                command=lambda: ClientManager.open_social_link('website', self.client['website'])
-            )
-            web_btn.pack(side="left", padx=2)
 
-        # Edit button
-        edit_btn = ctk.CTkButton(
-            socials_frame,
-            text="\u270E",
-            font=ctk.CTkFont(size=11),
-            fg_color="transparent",
-            hover_color=COLORS['bg_hover'],
-            width=28,
-            height=24,
-            corner_radius=4,
-            text_color=COLORS['fg_dim'],
-            command=self._on_edit_click
-        )
-        edit_btn.pack(side="left", padx=(SPACING['sm'], 0))
+        self._draw_actions()
+
+    def update_data(self, client: dict):
+        """Rebind this row to another client by redrawing the canvas items."""
+        self.client = client
+        self._on_leave(None)  # A recycled row may still be in hover state
+        self._build_ui()
+
+    def _draw_actions(self):
+        """Draw the right-aligned social/edit icons and register their hit regions."""
+        self.delete("action")
+        self._hit_starts = []
+        self._hit_regions = []
+        self._hover_region = None
+
+        width = self.winfo_width()
+        if width <= 1:
+            return  # Not mapped yet - drawn on first <Configure>
+
+        c = self.client
+        instagram = c.get('instagram')
+        twitter = c.get('twitter')
+        website = c.get('website')
+        px = self._px
+        icon_size = px(16)
+
+        # (width, PhotoImage or None, fallback glyph, hover color, command)
+        actions = []
+        if instagram:
+            actions.append((28, _get_row_icon(INSTAGRAM_LOGO, icon_size), "\u25CE", "#E1306C",
+                            partial(ClientManager.open_social_link, 'instagram', instagram)))
+        if twitter:
+            actions.append((28, _get_row_icon(TWITTER_LOGO, icon_size), "\u2573", "#000000",  # X black
+                            partial(ClientManager.open_social_link, 'twitter', twitter)))
+        if website:
+            actions.append((32, None, "\u2197", COLORS['accent'],
+                            partial(ClientManager.open_social_link, 'website', website)))
+
+        # Lay out left to right, ending at the edit button on the right edge
+        total = px(sum(a[0] + 4 for a in actions) + SPACING['sm'] + 28)
+        x = width - px(SPACING['md']) - total
+        mid_y = px(self.HEIGHT) // 2
+        half = px(12)
+        icon_font = FontCache.get(px(12))
+        regions = []
+        for w, icon, glyph, hover_color, command in actions:
+            x += px(2)
+            w = px(w)
+            rect = self.create_rectangle(x, mid_y - half, x + w, mid_y + half,
+                                         fill=COLORS['bg_hover'], outline="", tags="action")
+            if icon is not None:
+                self.create_image(x + w // 2, mid_y, image=icon, tags="action")
+            else:
+                self.create_text(x + w // 2, mid_y, text=glyph, fill=COLORS['fg'],
+                                 font=icon_font, tags="action")
+            regions.append((x, x + w, command, rect, COLORS['bg_hover'], hover_color))
+            x += w + px(2)
+
+        # Edit button (no background until hovered)
+        x += px(SPACING['sm'])
+        w = px(28)
+        rect = self.create_rectangle(x, mid_y - half, x + w, mid_y + half,
+                                     fill="", outline="", tags="action")
+        self.create_text(x + w // 2, mid_y, text="\u270E", fill=COLORS['fg_dim'],
+                         font=FontCache.get(px(11)), tags="action")
+        regions.append((x, x + w, self._on_edit_click, rect, "", COLORS['bg_hover']))
+
+        self._hit_regions = regions
+        self._hit_starts = [r[0] for r in regions]
+
+    def _on_configure(self, event):
+        """Re-anchor the right-aligned actions when the row width changes."""
+        self._draw_actions()
+
+    def _region_at(self, x: int, y: int):
+        """Return the action hit region under (x, y), or None."""
+        if abs(y - self._px(self.HEIGHT) // 2) > self._px(12):
+            return None
+        idx = bisect_right(self._hit_starts, x) - 1
+        if idx >= 0 and x <= self._hit_regions[idx][1]:
+            return self._hit_regions[idx]
+        return None
+
+    def _on_click(self, event):
+        """Dispatch a click to the action under the pointer."""
+        region = self._region_at(event.x, event.y)
+        if region is not None:
+            region[2]()
+
+    def _on_motion(self, event):
+        """Highlight the action under the pointer, recoloring only on change."""
+        region = self._region_at(event.x, event.y)
+        if region is not self._hover_region:
+            self._set_region_hover(region)
+
+    def _set_region_hover(self, region):
+        """Move the action highlight to region (None clears it)."""
+        previous = self._hover_region
+        if previous is not None:
+            self.itemconfigure(previous[3], fill=previous[4])
+        if region is not None:
+            self.itemconfigure(region[3], fill=region[5])
+        self._hover_region = region
 
     def _bind_hover(self):
         """Bind hover effects."""
@@ -402,13 +661,196 @@ class ClientListRow(ctk.CTkFrame):
 
     def _on_enter(self, event):
         """Handle mouse enter."""
-        self.configure(fg_color=COLORS['bg_hover'])
+        if self._hover_state:
+            return
+        self._hover_state = True
+        self.configure(bg=COLORS['bg_hover'])
 
     def _on_leave(self, event):
         """Handle mouse leave."""
-        self.configure(fg_color=COLORS['bg_card'])
+        if self._hover_region is not None:
+            self._set_region_hover(None)
+        if not self._hover_state:
+            return
+        self._hover_state = False
+        self.configure(bg=COLORS['bg_card'])
 
     def _on_edit_click(self):
         """Handle edit button click."""
         if self.on_edit:
             self.on_edit(self.client)
+
+
+class CardPool:
+    """Viewport-aware pool of recycled ClientCard/ClientListRow widgets.
+
+    PERFORMANCE: Only items whose row intersects the visible area (plus
+    overscan) get a widget. Widgets scrolled out of view go back to the
+    pool and are rebound to new clients via update_data() instead of being
+    destroyed and rebuilt, so widget count is O(viewport), not O(clients).
+
+    Each widget lives in a plain tk.Frame slot that the pool places. CTk
+    widgets refuse width/height in place() and scale x/y, so placing the
+    slot keeps the geometry in screen pixels; item_height must be in
+    screen pixels too (see ClientCard.natural_height).
+    """
+
+    OVERSCAN = 2  # Extra rows rendered above/below the viewport
+    CREATE_CHUNK = 12  # Max new widgets built per pass; the rest follow on idle
+
+    def __init__(self, container, viewport, factory, item_height: int, gap: int = 0,
+                 slot_bg: str = COLORS['bg_main']):
+        """
+        Args:
+            container: Frame the widgets are placed in (inside the scrolled area).
+            viewport: The scrolling canvas, used to measure the visible region.
+            factory: Callable (parent, client) -> widget with update_data().
+            item_height: Fixed height of one row of items, including the gap.
+            gap: Padding between items (px).
+            slot_bg: Background of the slot frames, matching the container.
+        """
+        self.container = container
+        self.viewport = viewport
+        self.factory = factory
+        self.item_height = item_height
+        self.gap = gap
+        self.slot_bg = slot_bg
+        self.items = []
+        self.columns = 1
+        self._active = {}  # item index -> widget
+        self._free = []    # Hidden widgets ready for reuse
+        self._range = (0, -1)
+        self._generation = 0  # Bumped on set_items/clear to drop stale chunk callbacks
+        self._height = 1      # Current spacer height
+
+        # Spacer gives the container the full scrollable height (a plain frame,
+        # so its height is not DPI-scaled like CTk widget sizes)
+        self._spacer = tk.Frame(container, bg=slot_bg, height=1, width=1, bd=0, highlightthickness=0)
+        self._spacer.pack(fill="x")
+        self._spacer.pack_propagate(False)
+
+    def set_items(self, items: list, columns: int = 1):
+        """Show a new item list, recycling the currently rendered widgets.
+
+        Widgets already showing a client that is still in the list are kept
+        for that client (matched by id), so a refresh that only narrows or
+        reorders the list does not rebind them.
+        """
+        self.items = items
+        self.columns = max(1, columns)
+        num_rows = (len(items) + self.columns - 1) // self.columns
+        height = max(1, num_rows * self.item_height)
+        if height != self._height:  # Skip the reconfigure when the row count holds
+            self._spacer.configure(height=height)
+            self._height = height
+
+        recycled = {widget.client['id']: widget for widget in self._active.values()}
+        self._active = {}
+        self._range = (0, -1)
+        self._generation += 1
+        self.update_visible(recycled)
+
+    def update_visible(self, recycled: dict = None):
+        """Render the items intersecting the viewport, recycling the rest.
+
+        Args:
+            recycled: Client id -> widget map of released widgets to reuse
+                for the same client first; leftovers go back to the pool.
+        """
+        recycled = recycled or {}
+        try:
+            self._render(recycled)
+        finally:
+            for widget in recycled.values():
+                widget.master.place_forget()
+                self._free.append(widget)
+
+    def _render(self, recycled: dict):
+        """Place widgets for the visible range (see update_visible)."""
+        if not self.items:
+            return
+        try:
+            visible_top = self.viewport.winfo_rooty() - self.container.winfo_rooty()
+            viewport_height = self.viewport.winfo_height()
+        except tk.TclError:
+            return
+
+        num_rows = (len(self.items) + self.columns - 1) // self.columns
+        first_row = max(0, visible_top // self.item_height - self.OVERSCAN)
+        last_row = min(num_rows - 1, (visible_top + viewport_height) // self.item_height + self.OVERSCAN)
+        if (first_row, last_row) == self._range:
+            return
+
+        first = first_row * self.columns
+        last = min(len(self.items), (last_row + 1) * self.columns)
+
+        # Release widgets that left the visible range
+        for idx in [i for i in self._active if i < first or i >= last]:
+            widget = self._active.pop(idx)
+            widget.master.place_forget()
+            self._free.append(widget)
+
+        # Bind widgets to items that entered the visible range
+        relwidth = 1.0 / self.columns
+        created = 0
+        for idx in range(first, last):
+            if idx in self._active:
+                continue
+            client = self.items[idx]
+            widget = recycled.pop(client['id'], None)
+            if widget is not None:
+                # Same contact - only rebind if its fields changed
+                shown = widget.client
+                if any(shown.get(key) != value for key, value in client.items()):
+                    widget.update_data(client)
+            elif self._free:
+                widget = self._free.pop()
+                widget.update_data(client)
+            elif created < self.CREATE_CHUNK:
+                widget = self._create_widget(client)
+                created += 1
+            else:
+                # PERFORMANCE: Paint what exists now and build the rest on the
+                # next idle pass, so a first render never blocks for long
+                self.container.after_idle(self._render_next_chunk, self._generation)
+                return
+            row, col = divmod(idx, self.columns)
+            widget.master.place(
+                relx=col * relwidth, x=self.gap,
+                y=row * self.item_height + self.gap,
+                relwidth=relwidth, width=-2 * self.gap,
+                height=self.item_height - 2 * self.gap
+            )
+            self._active[idx] = widget
+
+        self._range = (first_row, last_row)
+
+    def _create_widget(self, client: dict):
+        """Build a widget for client inside a new slot frame."""
+        slot = tk.Frame(self.container, bg=self.slot_bg, bd=0, highlightthickness=0)
+        widget = self.factory(slot, client)
+        widget.pack(fill="both", expand=True)
+        return widget
+
+    def refresh_item(self, idx: int):
+        """Rebind the widget showing item idx (if rendered) after an in-place edit."""
+        widget = self._active.get(idx)
+        if widget is not None:
+            widget.update_data(self.items[idx])
+
+    def _render_next_chunk(self, generation: int):
+        """Continue a chunked render unless the items changed meanwhile."""
+        if generation == self._generation:
+            self.update_visible()
+
+    def clear(self):
+        """Destroy all pooled widgets."""
+        for widget in list(self._active.values()) + self._free:
+            widget.master.destroy()  # The slot, and the widget with it
+        self._active = {}
+        self._free = []
+        self.items = []
+        self._range = (0, -1)
+        self._generation += 1
+        self._spacer.configure(height=1)
+        self._height = 1
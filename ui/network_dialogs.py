@@ -1,11 +1,58 @@
 """Network dialogs for ProducerOS - Add/Edit contact dialogs."""
 
+from tkinter import messagebox
+
 import customtkinter as ctk
-from ui.theme import COLORS, SPACING
+from ui.theme import COLORS, SPACING, FontCache
 
 # Available role options for contacts
 ROLE_OPTIONS = ['Producer', 'Artist']
 
+# Bind tag shared by all required entries - one class binding validates every
+# required field instead of two closures per entry
+_REQUIRED_TAG = "RequiredField"
+_required_tag_bound = False
+
+
+def _validate_required_out(event):
+    """Schedule the error/success border for a required field that lost focus.
+
+    PERFORMANCE: Deferred to after_idle so rapid tab-through coalesces the
+    canvas redraw into one paint; only one validation is queued per entry.
+    """
+    entry = event.widget.master  # CTkEntry owning the inner tk.Entry
+    if getattr(entry, '_validate_after_id', None) is None:
+        entry._validate_after_id = entry.after_idle(_apply_required_border, entry)
+
+
+def _apply_required_border(entry):
+    """Color a required field's border by whether it has a value."""
+    entry._validate_after_id = None
+    if entry.winfo_exists():
+        entry.configure(border_color=COLORS['error'] if not entry.get().strip() else COLORS['success'])
+
+
+def _validate_required_in(event):
+    """Reset a required field to the neutral border while editing."""
+    entry = event.widget.master
+    # Drop a validation still queued from a previous focus-out
+    after_id = getattr(entry, '_validate_after_id', None)
+    if after_id is not None:
+        entry.after_cancel(after_id)
+        entry._validate_after_id = None
+    entry.configure(border_color=COLORS['border'])
+
+
+def _mark_required(entry):
+    """Attach required-field validation to a CTkEntry via the shared bind tag."""
+    global _required_tag_bound
+    if not _required_tag_bound:
+        entry.bind_class(_REQUIRED_TAG, "<FocusOut>", _validate_required_out)
+        entry.bind_class(_REQUIRED_TAG, "<FocusIn>", _validate_required_in)
+        _required_tag_bound = True
+    inner = entry._entry  # Focus events are delivered to the inner tk.Entry
+    inner.bindtags(inner.bindtags() + (_REQUIRED_TAG,))
+
 
 def show_success_toast(parent, message: str, duration: int = 2000):
     """Show a temporary success toast notification."""
@@ -24,30 +71,32 @@ def show_success_toast(parent, message: str, duration: int = 2000):
     )
     frame.pack(padx=2, pady=2)
 
+    text = f"✓ {message}"
+    font = FontCache.get(13)
     label = ctk.CTkLabel(
         frame,
-        text=f"✓ {message}",
-        font=ctk.CTkFont(size=13),
+        text=text,
+        font=font,
         text_color=COLORS['bg_darkest'],
         padx=16,
         pady=10
     )
     label.pack()
 
-    # Position toast at bottom center of parent window
-    toast.update_idletasks()
-    parent_x = parent.winfo_x()
-    parent_y = parent.winfo_y()
-    parent_width = parent.winfo_width()
-    parent_height = parent.winfo_height()
-
-    toast_width = toast.winfo_reqwidth()
-    toast_height = toast.winfo_reqheight()
+    # PERFORMANCE: Size the toast from font metrics instead of forcing a
+    # layout pass with update_idletasks() + winfo_req*. The metrics are in
+    # CTk's unscaled units, which geometry() scales for width and height.
+    toast_width = font.measure(text) + 2 * 16 + 2 * 2  # text + label padx + frame pad
+    # Line + label pady, but at least CTkLabel's 28px height; + frame pad
+    toast_height = max(font.metrics('linespace') + 2 * 10, 28) + 2 * 2
 
-    x = parent_x + (parent_width - toast_width) // 2
-    y = parent_y + parent_height - toast_height - 60  # 60px from bottom
+    # Position toast at bottom center of parent window. geometry() does not
+    # scale x/y, so center using the toast's on-screen size.
+    scaling = ctk.ScalingTracker.get_window_scaling(toast)
+    x = parent.winfo_x() + (parent.winfo_width() - round(toast_width * scaling)) // 2
+    y = parent.winfo_y() + parent.winfo_height() - round((toast_height + 60) * scaling)  # 60px from bottom
 
-    toast.geometry(f"+{x}+{y}")
+    toast.geometry(f"{toast_width}x{toast_height}+{x}+{y}")
     toast.deiconify()  # Show toast
 
     # Auto-hide after duration
@@ -57,259 +106,169 @@ def show_success_toast(parent, message: str, duration: int = 2000):
     toast.after(duration, hide_toast)
 
 
-class AddClientDialog(ctk.CTkToplevel):
-    """Dialog for adding a new contact."""
+class _ConfirmDialog(ctk.CTkToplevel):
+    """Reusable yes/no confirmation dialog.
 
-    def __init__(self, parent, on_save=None, **kwargs):
-        super().__init__(parent, **kwargs)
+    PERFORMANCE: Built once on first use and then only withdrawn/deiconified,
+    instead of spawning a native blocking messagebox per confirmation.
+    wait_variable() keeps the Tk event loop running while waiting.
+    """
 
-        self.on_save = on_save
+    _instance = None
 
-        self.title("Add Contact")
-        self.geometry("450x580")  # Taller to accommodate role field
-        self.minsize(400, 450)
-        self.resizable(True, True)
+    def __init__(self, root):
+        super().__init__(root)
+        self.withdraw()
+        self.resizable(False, False)
         self.configure(fg_color=COLORS['bg_main'])
+        self.protocol("WM_DELETE_WINDOW", lambda: self._result.set(False))
 
-        # Make modal
-        self.transient(parent)
-        self.grab_set()
-
-        # Center on parent
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - 450) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - 540) // 2
-        self.geometry(f"+{x}+{y}")
-
-        self._build_ui()
+        self._result = ctk.BooleanVar(value=False)
 
-        # Focus on name field
-        self.name_entry.focus()
-
-    def _build_ui(self):
-        """Build the dialog UI."""
-        # Use grid layout for proper expansion
-        self.grid_rowconfigure(1, weight=1)
-        self.grid_columnconfigure(0, weight=1)
-
-        # Header
-        header = ctk.CTkLabel(
-            self,
-            text="Add New Contact",
-            font=ctk.CTkFont(family="Inter", size=20, weight="bold"),
-            text_color=COLORS['fg']
-        )
-        header.grid(row=0, column=0, pady=(SPACING['md'], SPACING['sm']))
-
-        # Scrollable form container
-        form = ctk.CTkScrollableFrame(
+        self._message = ctk.CTkLabel(
             self,
-            fg_color="transparent",
-            scrollbar_button_color=COLORS['bg_hover'],
-            scrollbar_button_hover_color=COLORS['accent']
-        )
-        form.grid(row=1, column=0, sticky="nsew", padx=SPACING['lg'], pady=SPACING['xs'])
-
-        # Name field (required)
-        self._create_field(form, "Name *", "name")
-
-        # Role dropdown
-        role_label = ctk.CTkLabel(
-            form,
-            text="Role",
-            font=ctk.CTkFont(family="Inter", size=12),
-            text_color=COLORS['fg_secondary'],
-            anchor="w"
-        )
-        role_label.pack(fill="x", pady=(SPACING['sm'], SPACING['xs']))
-
-        self.role_var = ctk.StringVar(value="Producer")
-        self.role_dropdown = ctk.CTkOptionMenu(
-            form,
-            variable=self.role_var,
-            values=ROLE_OPTIONS,
-            font=ctk.CTkFont(family="Inter", size=13),
-            fg_color=COLORS['bg_input'],
-            button_color=COLORS['bg_hover'],
-            button_hover_color=COLORS['accent'],
-            dropdown_fg_color=COLORS['bg_card'],
-            dropdown_hover_color=COLORS['bg_hover'],
-            height=40,
-            corner_radius=8
-        )
-        self.role_dropdown.pack(fill="x")
-
-        # Email field
-        self._create_field(form, "Email", "email")
-
-        # Phone field
-        self._create_field(form, "Phone", "phone")
-
-        # Instagram field
-        self._create_field(form, "Instagram", "instagram", placeholder="@handle or URL")
-
-        # Twitter field
-        self._create_field(form, "Twitter / X", "twitter", placeholder="@handle or URL")
-
-        # Website field
-        self._create_field(form, "Website", "website", placeholder="https://...")
-
-        # Notes field (multiline)
-        notes_label = ctk.CTkLabel(
-            form,
-            text="Notes",
-            font=ctk.CTkFont(family="Inter", size=12),
-            text_color=COLORS['fg_secondary'],
-            anchor="w"
-        )
-        notes_label.pack(fill="x", pady=(SPACING['sm'], SPACING['xs']))
-
-        self.notes_entry = ctk.CTkTextbox(
-            form,
-            height=60,
-            font=ctk.CTkFont(family="Inter", size=13),
-            fg_color=COLORS['bg_input'],
-            border_width=1,
-            border_color=COLORS['border'],
-            corner_radius=8,
-            text_color=COLORS['fg']
+            text="",
+            font=FontCache.get(13, family="Inter"),
+            text_color=COLORS['fg'],
+            justify="center",
+            wraplength=320
         )
-        self.notes_entry.pack(fill="x", pady=(0, SPACING['sm']))
+        self._message.pack(padx=SPACING['lg'], pady=(SPACING['lg'], SPACING['md']))
 
-        # Buttons at bottom (outside scrollable area)
         btn_frame = ctk.CTkFrame(self, fg_color="transparent")
-        btn_frame.grid(row=2, column=0, sticky="ew", padx=SPACING['lg'], pady=SPACING['md'])
+        btn_frame.pack(fill="x", padx=SPACING['lg'], pady=(0, SPACING['lg']))
 
         cancel_btn = ctk.CTkButton(
             btn_frame,
             text="Cancel",
-            font=ctk.CTkFont(family="Inter", size=13),
+            font=FontCache.get(13, family="Inter"),
             fg_color=COLORS['bg_hover'],
             hover_color=COLORS['bg_card'],
-            height=40,
+            height=36,
             corner_radius=8,
             text_color=COLORS['fg'],
-            command=self.destroy
+            command=lambda: self._result.set(False)
         )
         cancel_btn.pack(side="left", expand=True, fill="x", padx=(0, SPACING['sm']))
 
-        save_btn = ctk.CTkButton(
+        self._confirm_btn = ctk.CTkButton(
             btn_frame,
-            text="Add Contact",
-            font=ctk.CTkFont(family="Inter", size=13, weight="bold"),
-            fg_color=COLORS['accent'],
-            hover_color=COLORS['accent_hover'],
-            height=40,
+            text="",
+            font=FontCache.get(13, weight="bold", family="Inter"),
+            fg_color=COLORS['error'],
+            hover_color=COLORS['error'],
+            height=36,
             corner_radius=8,
             text_color="#ffffff",
-            command=self._on_save
-        )
-        save_btn.pack(side="right", expand=True, fill="x", padx=(SPACING['sm'], 0))
-
-    def _create_field(self, parent, label: str, field_name: str, placeholder: str = ""):
-        """Create a labeled input field with validation feedback for required fields."""
-        is_required = label.endswith("*")
-
-        label_widget = ctk.CTkLabel(
-            parent,
-            text=label,
-            font=ctk.CTkFont(family="Inter", size=12),
-            text_color=COLORS['fg_secondary'],
-            anchor="w"
-        )
-        label_widget.pack(fill="x", pady=(SPACING['sm'], SPACING['xs']))
-
-        entry = ctk.CTkEntry(
-            parent,
-            placeholder_text=placeholder,
-            height=40,
-            font=ctk.CTkFont(family="Inter", size=13),
-            fg_color=COLORS['bg_input'],
-            border_width=1,
-            border_color=COLORS['border'],
-            corner_radius=8,
-            text_color=COLORS['fg']
+            command=lambda: self._result.set(True)
         )
-        entry.pack(fill="x")
-
-        # Add validation feedback for required fields
-        if is_required:
-            def on_focus_out(event):
-                value = entry.get().strip()
-                if not value:
-                    entry.configure(border_color=COLORS['error'])
-                else:
-                    entry.configure(border_color=COLORS['success'])
-
-            def on_focus_in(event):
-                # Reset to neutral border when editing
-                entry.configure(border_color=COLORS['border'])
-
-            entry.bind("<FocusOut>", on_focus_out)
-            entry.bind("<FocusIn>", on_focus_in)
-
-        # Store reference
-        setattr(self, f"{field_name}_entry", entry)
-
-    def _on_save(self):
-        """Handle save button click."""
-        # Validate required fields
-        name = self.name_entry.get().strip()
-        if not name:
-            self.name_entry.configure(border_color=COLORS['error'])
-            return
+        self._confirm_btn.pack(side="right", expand=True, fill="x", padx=(SPACING['sm'], 0))
 
-        # Collect all data including role
-        data = {
-            'name': name,
-            'role': self.role_var.get(),
-            'email': self.email_entry.get().strip(),
-            'phone': self.phone_entry.get().strip(),
-            'instagram': self.instagram_entry.get().strip(),
-            'twitter': self.twitter_entry.get().strip(),
-            'website': self.website_entry.get().strip(),
-            'notes': self.notes_entry.get("1.0", "end-1c").strip()
-        }
-
-        # Call save callback
-        if self.on_save:
-            self.on_save(data)
+    @classmethod
+    def ask(cls, parent, title: str, message: str, confirm_text: str = "Delete") -> bool:
+        """Show the confirmation over parent and wait for an answer.
 
-        # Show success toast before destroying dialog
-        show_success_toast(self.master, "Contact added successfully!")
-        self.destroy()
+        Returns:
+            True if the user confirmed.
+        """
+        dialog = cls._instance
+        if dialog is None or not dialog.winfo_exists():
+            dialog = cls._instance = cls(parent._root())
 
+        dialog.title(title)
+        dialog._message.configure(text=message)
+        dialog._confirm_btn.configure(text=confirm_text)
+        dialog.transient(parent)
 
-class EditClientDialog(ctk.CTkToplevel):
-    """Dialog for editing an existing contact."""
+        # Center on parent
+        x = parent.winfo_rootx() + (parent.winfo_width() - 360) // 2
+        y = parent.winfo_rooty() + (parent.winfo_height() - 170) // 2
+        dialog.geometry(f"360x170+{x}+{y}")
+
+        previous_grab = dialog.grab_current()
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+        dialog._confirm_btn.focus_set()
+
+        dialog.wait_variable(dialog._result)
+
+        dialog.grab_release()
+        dialog.withdraw()
+        if previous_grab is not None and previous_grab.winfo_exists():
+            previous_grab.grab_set()
+        return dialog._result.get()
+
+
+class _ContactDialogBase(ctk.CTkToplevel):
+    """Shared contact form used by the Add and Edit contact dialogs.
+
+    Subclasses set the window text/size constants, may add widgets below the
+    notes field via _build_extra(), and supply the on_save arguments via
+    _save_args(). on_save returns a truthy value when the save succeeded.
+    """
+
+    TITLE = "Contact"
+    HEADER = "Contact"
+    SAVE_TEXT = "Save"
+    SUCCESS_MESSAGE = "Contact saved successfully!"
+    HEIGHT = 580
+    MIN_HEIGHT = 450
+
+    # Text fields in display order: (field name, label, placeholder)
+    FIELDS = (
+        ("name", "Name *", ""),
+        ("email", "Email", ""),
+        ("phone", "Phone", ""),
+        ("instagram", "Instagram", "@handle or URL"),
+        ("twitter", "Twitter / X", "@handle or URL"),
+        ("website", "Website", "https://..."),
+    )
+    _FIELD_NAMES = frozenset(field[0] for field in FIELDS)
 
-    def __init__(self, parent, client: dict, on_save=None, on_delete=None, **kwargs):
+    def __init__(self, parent, initial: dict = None, **kwargs):
         super().__init__(parent, **kwargs)
 
-        self.client = client
-        self.on_save = on_save
-        self.on_delete = on_delete
+        self.initial = initial or {}
 
-        self.title("Edit Contact")
-        self.geometry("450x600")  # Taller to accommodate role field
-        self.minsize(400, 480)
+        self.title(self.TITLE)
+        self.minsize(400, self.MIN_HEIGHT)
         self.resizable(True, True)
         self.configure(fg_color=COLORS['bg_main'])
 
-        # Make modal
+        # Keep on top of the parent; no global grab - only the delete
+        # confirmation needs true modality
         self.transient(parent)
-        self.grab_set()
 
-        # Center on parent
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - 450) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - 560) // 2
-        self.geometry(f"+{x}+{y}")
+        # Size and center on parent in one request - the parent's geometry is
+        # already valid, so no layout pass is needed first
+        self._parent_center = (
+            parent.winfo_x() + parent.winfo_width() // 2,
+            parent.winfo_y() + parent.winfo_height() // 2,
+        )
+        self._place(self.HEIGHT)  # Tall enough for the role field
 
         self._build_ui()
 
+        # Single layout pass now that all widgets exist, to measure the form
+        self.update_idletasks()
+        height = self._fit_form()
+        if height != self.HEIGHT:
+            self._place(height)
+
+    def _place(self, height: int):
+        """Set the window size and center it on the parent."""
+        cx, cy = self._parent_center
+        self.geometry(f"450x{height}+{cx - 225}+{cy - height // 2}")
+
     def _build_ui(self):
         """Build the dialog UI."""
+        # PERFORMANCE: Bind the theme tables to locals for the builder lookups
+        c, s = COLORS, SPACING
+
+        # PERFORMANCE: Freeze geometry propagation while children are added
+        self.grid_propagate(False)
+
         # Use grid layout for proper expansion
         self.grid_rowconfigure(1, weight=1)
         self.grid_columnconfigure(0, weight=1)
@@ -317,223 +276,321 @@ class EditClientDialog(ctk.CTkToplevel):
         # Header
         header = ctk.CTkLabel(
             self,
-            text="Edit Contact",
-            font=ctk.CTkFont(family="Inter", size=20, weight="bold"),
-            text_color=COLORS['fg']
+            text=self.HEADER,
+            font=FontCache.get(20, weight="bold", family="Inter"),
+            text_color=c['fg']
         )
-        header.grid(row=0, column=0, pady=(SPACING['md'], SPACING['sm']))
+        header.grid(row=0, column=0, pady=(s['md'], s['sm']))
 
-        # Scrollable form container
-        form = ctk.CTkScrollableFrame(
-            self,
-            fg_color="transparent",
-            scrollbar_button_color=COLORS['bg_hover'],
-            scrollbar_button_hover_color=COLORS['accent']
-        )
-        form.grid(row=1, column=0, sticky="nsew", padx=SPACING['lg'], pady=SPACING['xs'])
+        # PERFORMANCE: Start with a plain frame - the scrollable canvas stack is
+        # only built if the form stops fitting (see _check_form_fits)
+        self._form_scrollable = False
+        self._form = self._build_form(self.initial, scrollable=False)
 
-        # Name field (required)
-        self._create_field(form, "Name *", "name", self.client.get('name', ''))
+        # Buttons at bottom (outside the form area)
+        btn_frame = ctk.CTkFrame(self, fg_color="transparent")
+        btn_frame.grid(row=2, column=0, sticky="ew", padx=s['lg'], pady=s['md'])
 
-        # Role dropdown
-        role_label = ctk.CTkLabel(
-            form,
-            text="Role",
-            font=ctk.CTkFont(family="Inter", size=12),
-            text_color=COLORS['fg_secondary'],
-            anchor="w"
+        cancel_btn = ctk.CTkButton(
+            btn_frame,
+            text="Cancel",
+            font=FontCache.get(13, family="Inter"),
+            fg_color=c['bg_hover'],
+            hover_color=c['bg_card'],
+            height=40,
+            corner_radius=8,
+            text_color=c['fg'],
+            command=self.destroy
         )
-        role_label.pack(fill="x", pady=(SPACING['sm'], SPACING['xs']))
+        cancel_btn.pack(side="left", expand=True, fill="x", padx=(0, s['sm']))
 
-        current_role = self.client.get('role', 'Producer')
-        self.role_var = ctk.StringVar(value=current_role)
-        self.role_dropdown = ctk.CTkOptionMenu(
-            form,
-            variable=self.role_var,
-            values=ROLE_OPTIONS,
-            font=ctk.CTkFont(family="Inter", size=13),
-            fg_color=COLORS['bg_input'],
-            button_color=COLORS['bg_hover'],
-            button_hover_color=COLORS['accent'],
-            dropdown_fg_color=COLORS['bg_card'],
-            dropdown_hover_color=COLORS['bg_hover'],
+        save_btn = ctk.CTkButton(
+            btn_frame,
+            text=self.SAVE_TEXT,
+            font=FontCache.get(13, weight="bold", family="Inter"),
+            fg_color=c['accent'],
+            hover_color=c['accent_hover'],
             height=40,
-            corner_radius=8
+            corner_radius=8,
+            text_color="#ffffff",
+            command=self._on_save
         )
-        self.role_dropdown.pack(fill="x")
-
-        # Email field
-        self._create_field(form, "Email", "email", self.client.get('email', ''))
-
-        # Phone field
-        self._create_field(form, "Phone", "phone", self.client.get('phone', ''))
-
-        # Instagram field
-        self._create_field(form, "Instagram", "instagram", self.client.get('instagram', ''), "@handle or URL")
-
-        # Twitter field
-        self._create_field(form, "Twitter / X", "twitter", self.client.get('twitter', ''), "@handle or URL")
-
-        # Website field
-        self._create_field(form, "Website", "website", self.client.get('website', ''), "https://...")
+        save_btn.pack(side="right", expand=True, fill="x", padx=(s['sm'], 0))
+
+        self.grid_propagate(True)
+
+    def _build_form(self, values: dict, scrollable: bool):
+        """Create the form container and its fields, filled from values."""
+        c, s = COLORS, SPACING
+        if scrollable:
+            form = ctk.CTkScrollableFrame(
+                self,
+                fg_color="transparent",
+                scrollbar_button_color=c['bg_hover'],
+                scrollbar_button_hover_color=c['accent']
+            )
+        else:
+            form = ctk.CTkFrame(self, fg_color="transparent")
+        form.grid(row=1, column=0, sticky="nsew", padx=s['lg'], pady=s['xs'])
+        # PERFORMANCE: Grid the form in one column - a single layout pass
+        # instead of pack's per-child cavity subdivision
+        form.grid_columnconfigure(0, weight=1)
+        self._row = 0
+
+        # Text fields, with the role dropdown right under the name
+        for field_name, label, placeholder in self.FIELDS:
+            self._create_field(form, label, field_name, placeholder)
+            if field_name == 'name':
+                self._create_role_field(form, values.get('role', 'Producer'))
+
+        # Fill initial values in one pass, touching only populated fields
+        for key, value in values.items():
+            if value and key in self._FIELD_NAMES:
+                getattr(self, f"{key}_entry").insert(0, value)
 
         # Notes field (multiline)
         notes_label = ctk.CTkLabel(
             form,
             text="Notes",
-            font=ctk.CTkFont(family="Inter", size=12),
-            text_color=COLORS['fg_secondary'],
+            font=FontCache.get(12, family="Inter"),
+            text_color=c['fg_secondary'],
             anchor="w"
         )
-        notes_label.pack(fill="x", pady=(SPACING['sm'], SPACING['xs']))
+        self._grid_row(notes_label, pady=(s['sm'], s['xs']))
 
         self.notes_entry = ctk.CTkTextbox(
             form,
             height=60,
-            font=ctk.CTkFont(family="Inter", size=13),
-            fg_color=COLORS['bg_input'],
+            font=FontCache.get(13, family="Inter"),
+            fg_color=c['bg_input'],
             border_width=1,
-            border_color=COLORS['border'],
+            border_color=c['border'],
             corner_radius=8,
-            text_color=COLORS['fg']
-        )
-        self.notes_entry.pack(fill="x")
-        if self.client.get('notes'):
-            self.notes_entry.insert("1.0", self.client['notes'])
-
-        # Delete button inside form
-        delete_btn = ctk.CTkButton(
-            form,
-            text="Delete Contact",
-            font=ctk.CTkFont(family="Inter", size=12),
-            fg_color="transparent",
-            hover_color=COLORS['error'],
-            height=32,
-            corner_radius=6,
-            text_color=COLORS['error'],
-            command=self._on_delete
+            text_color=c['fg']
         )
-        delete_btn.pack(pady=(SPACING['md'], SPACING['sm']))
-
-        # Buttons at bottom (outside scrollable area)
-        btn_frame = ctk.CTkFrame(self, fg_color="transparent")
-        btn_frame.grid(row=2, column=0, sticky="ew", padx=SPACING['lg'], pady=SPACING['md'])
-
-        cancel_btn = ctk.CTkButton(
-            btn_frame,
-            text="Cancel",
-            font=ctk.CTkFont(family="Inter", size=13),
-            fg_color=COLORS['bg_hover'],
-            hover_color=COLORS['bg_card'],
-            height=40,
-            corner_radius=8,
-            text_color=COLORS['fg'],
-            command=self.destroy
+        self._grid_row(self.notes_entry, pady=(0, s['sm']))
+        if values.get('notes'):
+            self.notes_entry.insert("1.0", values['notes'])
+
+        self._build_extra(form)
+        return form
+
+    def _fit_form(self) -> int:
+        """Return a window height that fits the plain form.
+
+        Falls back to the scrollable form on screens too short for it. Must
+        run after a layout pass so the requested height is known.
+        """
+        needed = self.winfo_reqheight()
+        if needed > self.winfo_screenheight() - 80:
+            self._switch_to_scrollable()
+            return self.HEIGHT
+        self.bind("<Configure>", self._on_configure, add="+")
+        scaling = ctk.ScalingTracker.get_window_scaling(self)
+        return max(self.HEIGHT, round(needed / scaling))
+
+    def _on_configure(self, event):
+        """Re-check the form fit after the window is resized."""
+        if event.widget is self and not self._form_scrollable:
+            # Let grid re-arrange the children before measuring
+            self.after_idle(self._check_form_fits)
+
+    def _check_form_fits(self):
+        """Swap to a scrollable form once the window is too short for it."""
+        form = self._form
+        if not self._form_scrollable and form.winfo_height() < form.winfo_reqheight():
+            self._switch_to_scrollable()
+
+    def _switch_to_scrollable(self):
+        """Rebuild the form inside a CTkScrollableFrame, keeping entered values."""
+        values = {name: getattr(self, f"{name}_entry").get() for name in self._FIELD_NAMES}
+        values['role'] = self.role_var.get()
+        values['notes'] = self.notes_entry.get("1.0", "end-1c")
+        self._form_scrollable = True
+        self._form.destroy()
+        self._form = self._build_form(values, scrollable=True)
+
+    def _grid_row(self, widget, sticky: str = "ew", **kwargs):
+        """Grid widget on the next form row."""
+        widget.grid(row=self._row, column=0, sticky=sticky, **kwargs)
+        self._row += 1
+
+    def _build_extra(self, form):
+        """Hook for subclass widgets below the notes field."""
+        pass
+
+    def _create_role_field(self, parent, role: str):
+        """Create the labeled role dropdown."""
+        c, s = COLORS, SPACING
+        role_label = ctk.CTkLabel(
+            parent,
+            text="Role",
+            font=FontCache.get(12, family="Inter"),
+            text_color=c['fg_secondary'],
+            anchor="w"
         )
-        cancel_btn.pack(side="left", expand=True, fill="x", padx=(0, SPACING['sm']))
+        self._grid_row(role_label, pady=(s['sm'], s['xs']))
 
-        save_btn = ctk.CTkButton(
-            btn_frame,
-            text="Save Changes",
-            font=ctk.CTkFont(family="Inter", size=13, weight="bold"),
-            fg_color=COLORS['accent'],
-            hover_color=COLORS['accent_hover'],
+        self.role_var = ctk.StringVar(value=role)
+        self.role_dropdown = ctk.CTkOptionMenu(
+            parent,
+            variable=self.role_var,
+            values=ROLE_OPTIONS,
+            font=FontCache.get(13, family="Inter"),
+            fg_color=c['bg_input'],
+            button_color=c['bg_hover'],
+            button_hover_color=c['accent'],
+            dropdown_fg_color=c['bg_card'],
+            dropdown_hover_color=c['bg_hover'],
             height=40,
-            corner_radius=8,
-            text_color="#ffffff",
-            command=self._on_save
+            corner_radius=8
         )
-        save_btn.pack(side="right", expand=True, fill="x", padx=(SPACING['sm'], 0))
+        self._grid_row(self.role_dropdown)
 
-    def _create_field(self, parent, label: str, field_name: str, value: str = "", placeholder: str = ""):
-        """Create a labeled input field with initial value and validation feedback for required fields."""
+    def _create_field(self, parent, label: str, field_name: str, placeholder: str = ""):
+        """Create a labeled input field with validation feedback for required fields."""
+        c, s = COLORS, SPACING
         is_required = label.endswith("*")
 
         label_widget = ctk.CTkLabel(
             parent,
             text=label,
-            font=ctk.CTkFont(family="Inter", size=12),
-            text_color=COLORS['fg_secondary'],
+            font=FontCache.get(12, family="Inter"),
+            text_color=c['fg_secondary'],
             anchor="w"
         )
-        label_widget.pack(fill="x", pady=(SPACING['sm'], SPACING['xs']))
+        self._grid_row(label_widget, pady=(s['sm'], s['xs']))
 
         entry = ctk.CTkEntry(
             parent,
             placeholder_text=placeholder,
             height=40,
-            font=ctk.CTkFont(family="Inter", size=13),
-            fg_color=COLORS['bg_input'],
+            font=FontCache.get(13, family="Inter"),
+            fg_color=c['bg_input'],
             border_width=1,
-            border_color=COLORS['border'],
+            border_color=c['border'],
             corner_radius=8,
-            text_color=COLORS['fg']
+            text_color=c['fg']
         )
-        entry.pack(fill="x")
-
-        # Set initial value
-        if value:
-            entry.insert(0, value)
+        self._grid_row(entry)
 
         # Add validation feedback for required fields
         if is_required:
-            def on_focus_out(event):
-                field_value = entry.get().strip()
-                if not field_value:
-                    entry.configure(border_color=COLORS['error'])
-                else:
-                    entry.configure(border_color=COLORS['success'])
-
-            def on_focus_in(event):
-                # Reset to neutral border when editing
-                entry.configure(border_color=COLORS['border'])
-
-            entry.bind("<FocusOut>", on_focus_out)
-            entry.bind("<FocusIn>", on_focus_in)
+            _mark_required(entry)
 
         # Store reference
         setattr(self, f"{field_name}_entry", entry)
 
-    def _on_save(self):
-        """Handle save button click."""
+    def _collect_data(self):
+        """Validate the form and collect its values.
+
+        Returns:
+            Dict of contact fields, or None if the required name is missing.
+        """
+        data = {name: getattr(self, f"{name}_entry").get().strip() for name, _, _ in self.FIELDS}
+
         # Validate required fields
-        name = self.name_entry.get().strip()
-        if not name:
+        if not data['name']:
             self.name_entry.configure(border_color=COLORS['error'])
+            return None
+
+        data['role'] = self.role_var.get()
+        data['notes'] = self.notes_entry.get("1.0", "end-1c").strip()
+        return data
+
+    def _save_args(self, data: dict) -> tuple:
+        """Arguments for the on_save callback, given the collected form data."""
+        return (data,)
+
+    def _on_save(self):
+        """Handle save button click."""
+        data = self._collect_data()
+        if data is None:
             return
 
-        # Collect all data including role
-        data = {
-            'name': name,
-            'role': self.role_var.get(),
-            'email': self.email_entry.get().strip(),
-            'phone': self.phone_entry.get().strip(),
-            'instagram': self.instagram_entry.get().strip(),
-            'twitter': self.twitter_entry.get().strip(),
-            'website': self.website_entry.get().strip(),
-            'notes': self.notes_entry.get("1.0", "end-1c").strip()
-        }
-
-        # Call save callback
+        # Stay open until the save succeeds, so a failed save keeps the
+        # user's input and tells them about it
         if self.on_save:
-            self.on_save(self.client['id'], data)
-
-        # Show success toast before destroying dialog
-        show_success_toast(self.master, "Contact updated successfully!")
+            try:
+                saved = self.on_save(*self._save_args(data))
+            except Exception as e:
+                messagebox.showerror("Save Error", f"Failed to save contact: {str(e)}", parent=self)
+                return
+            if not saved:
+                messagebox.showerror(
+                    "Save Error",
+                    "The contact could not be saved. It may have been deleted.",
+                    parent=self
+                )
+                return
+
+        parent = self.master
         self.destroy()
+        show_success_toast(parent, self.SUCCESS_MESSAGE)
+
+
+class AddClientDialog(_ContactDialogBase):
+    """Dialog for adding a new contact."""
+
+    TITLE = "Add Contact"
+    HEADER = "Add New Contact"
+    SAVE_TEXT = "Add Contact"
+    SUCCESS_MESSAGE = "Contact added successfully!"
+
+    def __init__(self, parent, on_save=None, **kwargs):
+        self.on_save = on_save
+        super().__init__(parent, **kwargs)
+
+        # Focus on name field
+        self.name_entry.focus()
+
+
+class EditClientDialog(_ContactDialogBase):
+    """Dialog for editing an existing contact."""
+
+    TITLE = "Edit Contact"
+    HEADER = "Edit Contact"
+    SAVE_TEXT = "Save Changes"
+    SUCCESS_MESSAGE = "Contact updated successfully!"
+    HEIGHT = 600
+    MIN_HEIGHT = 480
+
+    def __init__(self, parent, client: dict, on_save=None, on_delete=None, **kwargs):
+        self.client = client
+        self.on_save = on_save
+        self.on_delete = on_delete
+        super().__init__(parent, initial=client, **kwargs)
+
+    def _build_extra(self, form):
+        """Add the delete button inside the form."""
+        c, s = COLORS, SPACING
+        delete_btn = ctk.CTkButton(
+            form,
+            text="Delete Contact",
+            font=FontCache.get(12, family="Inter"),
+            fg_color="transparent",
+            hover_color=c['error'],
+            height=32,
+            corner_radius=6,
+            text_color=c['error'],
+            command=self._on_delete
+        )
+        self._grid_row(delete_btn, sticky="", pady=(s['sm'], s['sm']))
+
+    def _save_args(self, data: dict) -> tuple:
+        """Edits are saved against the contact's id."""
+        return (self.client['id'], data)
 
     def _on_delete(self):
         """Handle delete contact button click with confirmation."""
-        from tkinter import messagebox
-
-        # Show confirmation dialog using standard messagebox
-        result = messagebox.askyesno(
+        client = self.client
+        result = _ConfirmDialog.ask(
+            self,
             "Confirm Delete Contact",
-            f"Are you sure you want to delete:\n{self.client['name']}?\n\nThis action cannot be undone.",
-            icon='warning'
+            f"Are you sure you want to delete:\n{client['name']}?\n\nThis action cannot be undone."
         )
 
         if result:
             if self.on_delete:
-                self.on_delete(self.client['id'])
+                self.on_delete(client['id'])
             self.destroy()
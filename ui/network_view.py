@@ -1,8 +1,13 @@
 """Network View for ProducerOS - Interface for managing contacts and collaborators."""
 
+import sys
+import time
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import customtkinter as ctk
-from ui.theme import COLORS, SPACING
-from ui.network_card import ClientCard, ClientListRow
+from ui.theme import COLORS, SPACING, FontCache
+from ui.network_card import ClientCard, ClientListRow, CardPool, prepare_clients
 from ui.network_dialogs import AddClientDialog, EditClientDialog
 from core.client_manager import get_client_manager
 
@@ -18,8 +23,18 @@ class ClientsView(ctk.CTkFrame):
 
         self.client_manager = get_client_manager()
         self.clients = []
-        self.card_widgets = []
         self.current_view = "card"  # "card" or "list"
+        self._card_pool = None  # Virtualized cards (built on first card view)
+        self._list_pool = None  # Virtualized list rows (built on first list view)
+        self._visible_update_id = None
+        self._search_after_id = None
+        self._search_changed_at = 0.0
+        self._last_width = None  # Width seen by the last <Configure>
+        self._count_text = ""
+        # PERFORMANCE: Contacts are queried off the UI thread; the generation
+        # drops results of refreshes superseded while still in flight
+        self._fetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="clients")
+        self._refresh_generation = 0
 
         self._build_ui()
 
@@ -41,14 +56,14 @@ class ClientsView(ctk.CTkFrame):
         search_frame.pack(side="left", fill="y", padx=SPACING['lg'])
 
         self.search_var = ctk.StringVar()
-        self.search_var.trace('w', self._on_search_change)
+        self.search_var.trace_add('write', self._on_search_change)
         search_entry = ctk.CTkEntry(
             search_frame,
             textvariable=self.search_var,
             placeholder_text="Search contacts...",
             width=280,
             height=40,
-            font=ctk.CTkFont(family="Inter", size=13),
+            font=FontCache.get(13, family="Inter"),
             fg_color=COLORS['bg_input'],
             border_width=1,
             border_color=COLORS['border'],
@@ -62,7 +77,7 @@ class ClientsView(ctk.CTkFrame):
             search_frame,
             values=["Card", "List"],
             variable=self.view_mode_var,
-            font=ctk.CTkFont(family="Inter", size=11),
+            font=FontCache.get(11, family="Inter"),
             fg_color=COLORS['bg_hover'],
             selected_color=COLORS['accent'],
             selected_hover_color=COLORS['accent_hover'],
@@ -83,7 +98,7 @@ class ClientsView(ctk.CTkFrame):
             search_frame,
             variable=self.role_filter_var,
             values=["All", "Producer", "Artist"],
-            font=ctk.CTkFont(family="Inter", size=11),
+            font=FontCache.get(11, family="Inter"),
             fg_color=COLORS['bg_hover'],
             button_color=COLORS['bg_card'],
             button_hover_color=COLORS['accent'],
@@ -100,7 +115,7 @@ class ClientsView(ctk.CTkFrame):
         self.count_label = ctk.CTkLabel(
             self.topbar,
             text="",
-            font=ctk.CTkFont(family="Inter", size=12),
+            font=FontCache.get(12, family="Inter"),
             text_color=COLORS['fg_dim']
         )
         self.count_label.pack(side="right", padx=(0, SPACING['md']))
@@ -109,7 +124,7 @@ class ClientsView(ctk.CTkFrame):
         self.add_btn = ctk.CTkButton(
             self.topbar,
             text="+ Add Contact",
-            font=ctk.CTkFont(family="Inter", size=12),
+            font=FontCache.get(12, family="Inter"),
             fg_color=COLORS['accent'],
             hover_color=COLORS['accent_hover'],
             height=40,
@@ -120,19 +135,58 @@ class ClientsView(ctk.CTkFrame):
         self.add_btn.pack(side="right", padx=SPACING['lg'], pady=SPACING['sm'])
 
         # Content area - scrollable
-        self.content_frame = ctk.CTkScrollableFrame(
-            self,
-            fg_color="transparent",
-            scrollbar_button_color=COLORS['bg_hover'],
-            scrollbar_button_hover_color=COLORS['accent']
+        # PERFORMANCE: A plain canvas + inner frame instead of
+        # CTkScrollableFrame; the pools only need a scrolled area to place
+        # their widgets in, not CTk's styled wrapper
+        content_area = ctk.CTkFrame(self, fg_color="transparent")
+        content_area.pack(fill="both", expand=True, padx=SPACING['lg'], pady=SPACING['lg'])
+
+        self._scrollbar = ctk.CTkScrollbar(
+            content_area,
+            button_color=COLORS['bg_hover'],
+            button_hover_color=COLORS['accent']
         )
-        self.content_frame.pack(fill="both", expand=True, padx=SPACING['lg'], pady=SPACING['lg'])
+        self._scrollbar.pack(side="right", fill="y")
+
+        self._scroll_canvas = tk.Canvas(
+            content_area,
+            bg=COLORS['bg_main'],
+            highlightthickness=0,
+            bd=0,
+            yscrollincrement=20
+        )
+        self._scroll_canvas.pack(side="left", fill="both", expand=True)
+        self._scrollbar.configure(command=self._scroll_canvas.yview)
+
+        self.content_frame = tk.Frame(self._scroll_canvas, bg=COLORS['bg_main'])
+        self._content_window = self._scroll_canvas.create_window(
+            (0, 0), window=self.content_frame, anchor="nw"
+        )
+        self.content_frame.bind("<Configure>", self._on_content_configure)
+        self._scroll_canvas.bind("<Configure>", self._on_canvas_configure)
+        self.bind_all("<MouseWheel>", self._on_mouse_wheel, add="+")
+        self.bind_all("<Button-4>", self._on_mouse_wheel, add="+")
+        self.bind_all("<Button-5>", self._on_mouse_wheel, add="+")
+
+        # Hook the canvas scroll command so virtualized pools re-render on
+        # every scroll source (wheel, scrollbar drag, resize)
+        self._scroll_canvas.configure(yscrollcommand=self._on_content_scroll)
 
         # Card view container (grid)
+        # PERFORMANCE: The card, list and empty frames share grid cell (0, 0)
+        # and are swapped with grid_remove/grid, keeping their grid options
+        self.content_frame.grid_rowconfigure(0, weight=1)
+        self.content_frame.grid_columnconfigure(0, weight=1)
         self.card_container = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        self.card_container.pack(fill="both", expand=True)
+        self.card_container.grid(row=0, column=0, sticky="nsew")
+        self._shown_frame = self.card_container
+
+        # List view and empty state are built on first use
+        self.list_container = None
+        self.empty_frame = None
 
-        # List view container
+    def _build_list_container(self):
+        """Build the list view header and rows container (on first list view)."""
         self.list_container = ctk.CTkFrame(self.content_frame, fg_color="transparent")
 
         # List header
@@ -144,7 +198,7 @@ class ClientsView(ctk.CTkFrame):
         name_header = ctk.CTkLabel(
             self.list_header,
             text="Name",
-            font=ctk.CTkFont(family="Inter", size=11, weight="bold"),
+            font=FontCache.get(11, weight="bold", family="Inter"),
             text_color=COLORS['fg_secondary'],
             anchor="w",
             width=180
@@ -154,7 +208,7 @@ class ClientsView(ctk.CTkFrame):
         email_header = ctk.CTkLabel(
             self.list_header,
             text="Email",
-            font=ctk.CTkFont(family="Inter", size=11, weight="bold"),
+            font=FontCache.get(11, weight="bold", family="Inter"),
             text_color=COLORS['fg_secondary'],
             anchor="w",
             width=200
@@ -164,7 +218,7 @@ class ClientsView(ctk.CTkFrame):
         phone_header = ctk.CTkLabel(
             self.list_header,
             text="Phone",
-            font=ctk.CTkFont(family="Inter", size=11, weight="bold"),
+            font=FontCache.get(11, weight="bold", family="Inter"),
             text_color=COLORS['fg_secondary'],
             anchor="w",
             width=120
@@ -174,7 +228,7 @@ class ClientsView(ctk.CTkFrame):
         socials_header = ctk.CTkLabel(
             self.list_header,
             text="Socials",
-            font=ctk.CTkFont(family="Inter", size=11, weight="bold"),
+            font=FontCache.get(11, weight="bold", family="Inter"),
             text_color=COLORS['fg_secondary'],
             anchor="e"
         )
@@ -184,13 +238,14 @@ class ClientsView(ctk.CTkFrame):
         self.list_rows_container = ctk.CTkFrame(self.list_container, fg_color="transparent")
         self.list_rows_container.pack(fill="both", expand=True)
 
-        # Empty state
+    def _build_empty_frame(self):
+        """Build the empty-state frame (on first empty result)."""
         self.empty_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
 
         empty_icon = ctk.CTkLabel(
             self.empty_frame,
             text="\U0001f464",
-            font=ctk.CTkFont(size=48),
+            font=FontCache.get(48),
             text_color=COLORS['fg_dim']
         )
         empty_icon.pack(pady=(SPACING['xl'], SPACING['md']))
@@ -198,7 +253,7 @@ class ClientsView(ctk.CTkFrame):
         empty_msg = ctk.CTkLabel(
             self.empty_frame,
             text="No Contacts Yet",
-            font=ctk.CTkFont(family="Inter", size=18, weight="bold"),
+            font=FontCache.get(18, weight="bold", family="Inter"),
             text_color=COLORS['fg']
         )
         empty_msg.pack()
@@ -206,7 +261,7 @@ class ClientsView(ctk.CTkFrame):
         empty_submsg = ctk.CTkLabel(
             self.empty_frame,
             text="Add your first contact to start building\nyour producer network.",
-            font=ctk.CTkFont(family="Inter", size=13),
+            font=FontCache.get(13, family="Inter"),
             text_color=COLORS['fg_secondary'],
             justify="center"
         )
@@ -215,7 +270,7 @@ class ClientsView(ctk.CTkFrame):
         empty_add_btn = ctk.CTkButton(
             self.empty_frame,
             text="+ Add Contact",
-            font=ctk.CTkFont(family="Inter", size=14, weight="bold"),
+            font=FontCache.get(14, weight="bold", family="Inter"),
             fg_color=COLORS['accent'],
             hover_color=COLORS['accent_hover'],
             height=44,
@@ -227,18 +282,45 @@ class ClientsView(ctk.CTkFrame):
         empty_add_btn.pack()
 
     def refresh(self):
-        """Refresh the client list from database."""
+        """Refresh the client list from database (fetched in the background)."""
         search_query = self.search_var.get().strip() if hasattr(self, 'search_var') else None
-        self.clients = self.client_manager.get_clients(search=search_query if search_query else None)
-
-        # Apply role filter
         role_filter = self.role_filter_var.get() if hasattr(self, 'role_filter_var') else "All"
-        if role_filter != "All":
-            self.clients = [c for c in self.clients if c.get('role', 'Producer') == role_filter]
 
-        # Update count
+        self._refresh_generation += 1
+        generation = self._refresh_generation
+        future = self._fetch_executor.submit(
+            self._fetch_clients,
+            search_query if search_query else None,
+            role_filter if role_filter != "All" else None
+        )
+        future.add_done_callback(
+            lambda f: self.after(0, self._apply_clients, generation, f.result())
+        )
+
+    def _fetch_clients(self, search, role) -> list:
+        """Query clients and precompute their display data (worker thread).
+
+        Errors are caught here, since the future's result is only read in
+        a done-callback where they would vanish and the view never update.
+        """
+        try:
+            return prepare_clients(self.client_manager.get_clients(search=search, role=role))
+        except Exception as e:
+            print(f"Error loading clients: {e}")
+            return []
+
+    def _apply_clients(self, generation: int, clients: list):
+        """Show fetched clients on the UI thread."""
+        if generation != self._refresh_generation or not self.winfo_exists():
+            return  # Superseded by a newer refresh, or the view is gone
+        self.clients = clients
+
+        # Update count (skip the configure when the text is unchanged)
         count = len(self.clients)
-        self.count_label.configure(text=f"{count} contact{'s' if count != 1 else ''}")
+        count_text = f"{count} contact{'s' if count != 1 else ''}"
+        if count_text != self._count_text:
+            self.count_label.configure(text=count_text)
+            self._count_text = count_text
 
         # Show appropriate view
         if not self.clients:
@@ -248,72 +330,122 @@ class ClientsView(ctk.CTkFrame):
         else:
             self._show_list_view()
 
+    def _show_frame(self, frame, sticky: str = "nsew"):
+        """Swap the content area to frame, leaving the layout alone if it is already shown."""
+        # PERFORMANCE: Refreshes within the same view cause no geometry churn
+        if frame is self._shown_frame:
+            return
+        self._shown_frame.grid_remove()
+        frame.grid(row=0, column=0, sticky=sticky)
+        self._shown_frame = frame
+
     def _show_empty_state(self):
         """Show empty state."""
-        self.card_container.pack_forget()
-        self.list_container.pack_forget()
-        self.empty_frame.pack(expand=True)
+        if self.empty_frame is None:
+            self._build_empty_frame()
+        self._show_frame(self.empty_frame, sticky="")
 
     def _show_card_view(self):
-        """Display clients in card grid view."""
-        self.empty_frame.pack_forget()
-        self.list_container.pack_forget()
-        self.card_container.pack(fill="both", expand=True)
+        """Display clients in card grid view.
+
+        PERFORMANCE: Cards are virtualized like the list rows - only cards
+        on screen have widgets, recycled while scrolling.
+        """
+        self._show_frame(self.card_container)
 
-        # Clear existing cards
-        for widget in self.card_widgets:
-            widget.destroy()
-        self.card_widgets = []
+        num_columns = self._card_columns()
 
-        # Calculate columns based on container width
+        if self._card_pool is None:
+            self._card_pool = CardPool(
+                self.card_container,
+                self._scroll_canvas,
+                partial(ClientCard, on_edit=self._on_edit_client),
+                # Slots are in screen pixels, so size them from a measured card
+                item_height=ClientCard.natural_height(self.card_container) + 2 * SPACING['xs'],
+                gap=SPACING['xs']
+            )
+        # Toggling back to an up-to-date view just re-shows it
+        pool = self._card_pool
+        if pool.items is not self.clients or pool.columns != num_columns:
+            pool.set_items(self.clients, columns=num_columns)
+        self._schedule_visible_update()
+
+    def _card_columns(self) -> int:
+        """Number of card columns that fit the content width."""
         container_width = self.content_frame.winfo_width()
         if container_width < 100:
             container_width = 800  # Default fallback
+        return max(1, container_width // (self.CARD_MIN_WIDTH + SPACING['md']))
+
+    def _relayout_cards(self):
+        """Re-flow the card grid after a resize."""
+        # Cards stretch with relwidth, so only a column count change needs
+        # the items re-placed; otherwise just refresh the visible range
+        if self._card_pool is not None and self._card_columns() == self._card_pool.columns:
+            self._schedule_visible_update()
+        else:
+            self._show_card_view()
 
-        num_columns = max(1, container_width // (self.CARD_MIN_WIDTH + SPACING['md']))
+    def _show_list_view(self):
+        """Display clients in list view.
 
-        # Configure grid columns
-        for i in range(num_columns):
-            self.card_container.grid_columnconfigure(i, weight=1, uniform="card")
+        PERFORMANCE: Rows are virtualized - only visible rows have widgets,
+        and they are recycled while scrolling.
+        """
+        if self.list_container is None:
+            self._build_list_container()
+        self._show_frame(self.list_container)
 
-        # Create cards
-        for idx, client in enumerate(self.clients):
-            row = idx // num_columns
-            col = idx % num_columns
-
-            card = ClientCard(
-                self.card_container,
-                client,
-                on_edit=self._on_edit_client
+        if self._list_pool is None:
+            self._list_pool = CardPool(
+                self.list_rows_container,
+                self._scroll_canvas,
+                partial(ClientListRow, on_edit=self._on_edit_client),
+                item_height=ClientListRow.natural_height(self.list_rows_container) + 4,
+                gap=2
             )
-            card.grid(row=row, column=col, padx=SPACING['xs'], pady=SPACING['xs'], sticky="nsew")
-            self.card_widgets.append(card)
+        if self._list_pool.items is not self.clients:
+            self._list_pool.set_items(self.clients)
+        self._schedule_visible_update()
+
+    def _on_content_scroll(self, first, last):
+        """Forward scroll position to the scrollbar and refresh visible rows."""
+        self._scrollbar.set(first, last)
+        self._schedule_visible_update()
+
+    def _on_content_configure(self, event):
+        """Keep the scroll region matched to the content size."""
+        self._scroll_canvas.configure(scrollregion=(0, 0, event.width, event.height))
+
+    def _on_canvas_configure(self, event):
+        """Stretch the content frame to the visible canvas width."""
+        self._scroll_canvas.itemconfigure(self._content_window, width=event.width)
+
+    def _on_mouse_wheel(self, event):
+        """Scroll the content when the wheel turns over it."""
+        if not str(event.widget).startswith(str(self._scroll_canvas)):
+            return
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        elif sys.platform == 'darwin':
+            step = -event.delta
+        else:
+            step = -1 if event.delta > 0 else 1
+        self._scroll_canvas.yview_scroll(step * 3, "units")
 
-        # Configure rows
-        num_rows = (len(self.clients) + num_columns - 1) // num_columns
-        for i in range(num_rows):
-            self.card_container.grid_rowconfigure(i, weight=0)
+    def _schedule_visible_update(self):
+        """Coalesce visible-range updates into one idle callback."""
+        if self._visible_update_id is None:
+            self._visible_update_id = self.after_idle(self._update_visible_rows)
 
-    def _show_list_view(self):
-        """Display clients in list view."""
-        self.empty_frame.pack_forget()
-        self.card_container.pack_forget()
-        self.list_container.pack(fill="both", expand=True)
-
-        # Clear existing rows
-        for widget in self.card_widgets:
-            widget.destroy()
-        self.card_widgets = []
-
-        # Create rows
-        for client in self.clients:
-            row = ClientListRow(
-                self.list_rows_container,
-                client,
-                on_edit=self._on_edit_client
-            )
-            row.pack(fill="x", pady=2)
-            self.card_widgets.append(row)
+    def _update_visible_rows(self):
+        """Render the rows of the active virtualized view that are on screen."""
+        self._visible_update_id = None
+        pool = self._card_pool if self.current_view == "card" else self._list_pool
+        if pool is not None:
+            pool.update_visible()
 
     def _on_view_toggle(self, value):
         """Handle view toggle change."""
@@ -326,6 +458,19 @@ class ClientsView(ctk.CTkFrame):
 
     def _on_search_change(self, *args):
         """Handle search text change."""
+        # PERFORMANCE: Only timestamp the keystroke; one pending timer
+        # debounces the burst without an after_cancel per character
+        self._search_changed_at = time.monotonic()
+        if self._search_after_id is None:
+            self._search_after_id = self.after(200, self._on_search_idle)
+
+    def _on_search_idle(self):
+        """Run the search once typing has paused for 200 ms."""
+        remaining = 0.2 - (time.monotonic() - self._search_changed_at)
+        if remaining > 0:
+            self._search_after_id = self.after(int(remaining * 1000) + 1, self._on_search_idle)
+            return
+        self._search_after_id = None
         self.refresh()
 
     def _on_role_filter_change(self, value):
@@ -334,25 +479,58 @@ class ClientsView(ctk.CTkFrame):
 
     def _on_resize(self, event):
         """Handle window resize for responsive grid."""
+        # Only width changes can change the column count
+        if event.width == self._last_width:
+            return
+        self._last_width = event.width
         if self.current_view == "card" and self.clients:
             # Debounce resize events
             if hasattr(self, '_resize_after_id'):
                 self.after_cancel(self._resize_after_id)
-            self._resize_after_id = self.after(100, self._show_card_view)
+            self._resize_after_id = self.after(100, self._relayout_cards)
 
     def _on_add_client(self):
         """Handle Add Contact button click."""
         def on_save(data):
-            self.client_manager.add_client(data)
+            client_id = self.client_manager.add_client(data)
             self.refresh()
+            return client_id
 
         AddClientDialog(self.winfo_toplevel(), on_save=on_save)
 
+    def _update_client_in_place(self, client_id: int, data: dict):
+        """Show an edited contact by rebinding its widget, refreshing only if needed."""
+        for idx, client in enumerate(self.clients):
+            if client['id'] == client_id:
+                break
+        else:
+            self.refresh()
+            return
+
+        # Name drives the sort order, name/email the search and role the
+        # filter - if any changed the contact may move, so query again
+        if any(data.get(key, client.get(key)) != client.get(key) for key in ('name', 'email', 'role')):
+            self.refresh()
+            return
+
+        # PERFORMANCE: Both pools share self.clients, so one swap updates
+        # their data and only the visible widget for this contact is rebound
+        updated = {key: value for key, value in client.items() if key != '_notes_preview'}
+        updated.update(data)
+        self.clients[idx] = prepare_clients([updated])[0]
+        for pool in (self._card_pool, self._list_pool):
+            if pool is not None and pool.items is self.clients:
+                pool.refresh_item(idx)
+
     def _on_edit_client(self, client):
         """Handle edit contact request."""
         def on_save(client_id, data):
-            self.client_manager.update_client(client_id, data)
-            self.refresh()
+            updated = self.client_manager.update_client(client_id, data)
+            if updated:
+                self._update_client_in_place(client_id, data)
+            else:
+                self.refresh()  # Deleted elsewhere - drop it from the view
+            return updated
 
         def on_delete(client_id):
             self.client_manager.delete_client(client_id)
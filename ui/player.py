@@ -4,10 +4,137 @@ import os
 import struct
 import time
 import wave
+from functools import lru_cache
 import customtkinter as ctk
 import pygame
 from typing import Optional, List, Dict, Callable
-from ui.theme import COLORS
+from ui.theme import COLORS, FontCache
+
+# Duration probing (header-only metadata readers)
+try:
+    from tinytag import TinyTag
+    TINYTAG_AVAILABLE = True
+except ImportError:
+    TINYTAG_AVAILABLE = False
+
+try:
+    import mutagen
+    MUTAGEN_AVAILABLE = True
+except ImportError:
+    MUTAGEN_AVAILABLE = False
+
+
+@lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds: int) -> str:
+    """Format whole seconds as M:SS (memoized - the value changes once a second)."""
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+@lru_cache(maxsize=512)
+def _probe_duration(file_path: str, mtime_ns: int, size: int) -> float:
+    """Get audio duration in seconds without loading the entire file.
+
+    Uses efficient header-only parsing methods to avoid loading
+    large audio files into memory.
+
+    PERFORMANCE: Memoized per (path, mtime, size) so reloading a track skips
+    the tag/header parsing; a rewritten file gets a new key.
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+
+    # Method 1: Try tinytag (efficient, reads only metadata headers)
+    if TINYTAG_AVAILABLE:
+        try:
+            tag = TinyTag.get(file_path)
+            if tag.duration and tag.duration > 0:
+                return tag.duration
+        except Exception:
+            pass
+
+    # Method 2: For WAV files, read header directly (O(1) memory)
+    # This avoids pygame.mixer.Sound which loads the ENTIRE file
+    if ext == '.wav':
+        try:
+            duration = _wav_duration_from_header(file_path)
+            if duration > 0:
+                return duration
+        except Exception:
+            pass
+
+    # Method 3: Try mutagen (efficient metadata-only reading)
+    if MUTAGEN_AVAILABLE:
+        try:
+            audio = mutagen.File(file_path)
+            if audio and audio.info and audio.info.length:
+                return audio.info.length
+        except Exception:
+            pass
+
+    # Method 4: For FLAC, use stdlib wave module won't work,
+    # but we've covered it with tinytag/mutagen above
+
+    # NOTE: Removed pydub fallback as it loads entire file into memory
+    # which is extremely slow and memory-intensive for large files.
+    # If we reach here, duration will be unknown (0).
+    return 0
+
+
+def _wav_duration_from_header(file_path: str) -> float:
+    """Read WAV duration from file header without loading audio data.
+
+    WAV files have a fixed header format. We read only the header
+    bytes to calculate duration, using O(1) memory regardless of
+    file size.
+
+    Returns:
+        Duration in seconds, or 0 if unable to parse.
+    """
+    try:
+        with wave.open(file_path, 'rb') as wav_file:
+            # Get parameters from header (no audio data loaded)
+            frames = wav_file.getnframes()
+            rate = wav_file.getframerate()
+            if rate > 0:
+                return frames / rate
+    except Exception:
+        # Fallback: manually parse header for non-standard WAV files
+        try:
+            with open(file_path, 'rb') as f:
+                # Read RIFF header
+                riff = f.read(12)
+                if len(riff) < 12 or riff[:4] != b'RIFF' or riff[8:12] != b'WAVE':
+                    return 0
+
+                # Find fmt chunk
+                sample_rate = 0
+                byte_rate = 0
+                while True:
+                    chunk_header = f.read(8)
+                    if len(chunk_header) < 8:
+                        break
+                    chunk_id = chunk_header[:4]
+                    chunk_size = struct.unpack('<I', chunk_header[4:8])[0]
+
+                    if chunk_id == b'fmt ':
+                        fmt_data = f.read(min(chunk_size, 16))
+                        if len(fmt_data) >= 14:
+                            sample_rate = struct.unpack('<I', fmt_data[4:8])[0]
+                            byte_rate = struct.unpack('<I', fmt_data[8:12])[0]
+                        # Skip remaining fmt data
+                        remaining = chunk_size - len(fmt_data)
+                        if remaining > 0:
+                            f.seek(remaining, 1)
+                    elif chunk_id == b'data':
+                        # Found data chunk - calculate duration
+                        if byte_rate > 0:
+                            return chunk_size / byte_rate
+                        break
+                    else:
+                        # Skip this chunk
+                        f.seek(chunk_size, 1)
+        except Exception:
+            pass
+    return 0
 
 
 class FooterPlayer(ctk.CTkFrame):
@@ -37,9 +164,20 @@ class FooterPlayer(ctk.CTkFrame):
         self._seek_target: float = 0  # Target position after seek
         self._seek_time: float = 0  # Time when last seek occurred
         self._get_pos_at_seek: int = 0  # get_pos() value when seek occurred
+        self._drag_label_job = None  # Pending time-label update while dragging
+        self._pending_drag_pos: float = 0
+        self._last_time_current = "0:00"  # Text shown in the elapsed-time label
+        self._last_slider_step = 0  # Seek slider position in slider steps
+        self._last_info_line = ""  # Text shown in the track info label
+        self._last_busy_check: float = 0  # Monotonic time of the last get_busy() poll
+        self._end_job = None  # Fires when the track is expected to finish
+        self._seek_job = None  # Pending coalesced seek
+        self._pending_seek_value: float = 0
+        self._last_seek_at: float = 0  # Monotonic time of the last performed seek
 
         # UI update timer
         self._update_job = None
+        self._ui_next_deadline: float = 0  # Monotonic time of the next UI tick
 
         # Tooltip reference for cleanup
         self._active_tooltip = None
@@ -237,6 +375,8 @@ class FooterPlayer(ctk.CTkFrame):
 
     def load_track(self, sample: Dict, playlist: List[Dict] = None, index: int = 0):
         """Load a track for playback."""
+        self._cancel_pending_seek()  # Belongs to the previous track
+        self._cancel_track_end()
         # Stop current playback when loading a new track
         if self.is_playing or self.is_paused:
             # STARTUP OPTIMIZATION: Only stop pygame if mixer is initialized
@@ -254,6 +394,19 @@ class FooterPlayer(ctk.CTkFrame):
             self.playlist = [sample]
             self.playlist_index = 0
 
+        # Always rebuilt: the library updates detected BPM/key on the same
+        # sample dict in place. The duration probe is cached per file and
+        # the info label is only reconfigured when its text changes.
+        self._show_track_details(sample)
+
+        # Reset position tracking
+        self.position_offset = 0
+        self._last_get_pos = 0
+        self._set_seek_slider(0)
+        self._set_time_current("0:00")
+
+    def _show_track_details(self, sample: Dict):
+        """Read the sample's duration and show its name, info and length."""
         # Get duration - prefer metadata duration, fallback to detection
         self.duration = sample.get('duration', 0) or self._get_duration(sample['path'])
 
@@ -282,117 +435,21 @@ class FooterPlayer(ctk.CTkFrame):
         if self.duration > 0:
             info_parts.append(self._format_time(self.duration))
 
-        self.track_info.configure(text=" • ".join(info_parts) if info_parts else "")
+        info_line = " • ".join(info_parts)
+        if info_line != self._last_info_line:
+            self.track_info.configure(text=info_line)
+            self._last_info_line = info_line
 
         # Update seek bar total time
         self.time_total.configure(text=self._format_time(self.duration))
 
-        # Reset position tracking
-        self.position_offset = 0
-        self._last_get_pos = 0
-        self.seek_slider.set(0)
-        self.time_current.configure(text="0:00")
-
     def _get_duration(self, file_path: str) -> float:
-        """Get audio duration in seconds without loading the entire file.
-
-        Uses efficient header-only parsing methods to avoid loading
-        large audio files into memory.
-        """
-        ext = os.path.splitext(file_path)[1].lower()
-
-        # Method 1: Try tinytag (efficient, reads only metadata headers)
-        try:
-            from tinytag import TinyTag
-            tag = TinyTag.get(file_path)
-            if tag.duration and tag.duration > 0:
-                return tag.duration
-        except Exception:
-            pass
-
-        # Method 2: For WAV files, read header directly (O(1) memory)
-        # This avoids pygame.mixer.Sound which loads the ENTIRE file
-        if ext == '.wav':
-            try:
-                duration = self._get_wav_duration_from_header(file_path)
-                if duration > 0:
-                    return duration
-            except Exception:
-                pass
-
-        # Method 3: Try mutagen (efficient metadata-only reading)
+        """Get audio duration in seconds (cached per file version)."""
         try:
-            import mutagen
-            audio = mutagen.File(file_path)
-            if audio and audio.info and audio.info.length:
-                return audio.info.length
-        except Exception:
-            pass
-
-        # Method 4: For FLAC, use stdlib wave module won't work,
-        # but we've covered it with tinytag/mutagen above
-
-        # NOTE: Removed pydub fallback as it loads entire file into memory
-        # which is extremely slow and memory-intensive for large files.
-        # If we reach here, duration will be unknown (0).
-        return 0
-
-    def _get_wav_duration_from_header(self, file_path: str) -> float:
-        """Read WAV duration from file header without loading audio data.
-
-        WAV files have a fixed header format. We read only the header
-        bytes to calculate duration, using O(1) memory regardless of
-        file size.
-
-        Returns:
-            Duration in seconds, or 0 if unable to parse.
-        """
-        try:
-            with wave.open(file_path, 'rb') as wav_file:
-                # Get parameters from header (no audio data loaded)
-                frames = wav_file.getnframes()
-                rate = wav_file.getframerate()
-                if rate > 0:
-                    return frames / rate
-        except Exception:
-            # Fallback: manually parse header for non-standard WAV files
-            try:
-                with open(file_path, 'rb') as f:
-                    # Read RIFF header
-                    riff = f.read(12)
-                    if len(riff) < 12 or riff[:4] != b'RIFF' or riff[8:12] != b'WAVE':
-                        return 0
-
-                    # Find fmt chunk
-                    sample_rate = 0
-                    byte_rate = 0
-                    while True:
-                        chunk_header = f.read(8)
-                        if len(chunk_header) < 8:
-                            break
-                        chunk_id = chunk_header[:4]
-                        chunk_size = struct.unpack('<I', chunk_header[4:8])[0]
-
-                        if chunk_id == b'fmt ':
-                            fmt_data = f.read(min(chunk_size, 16))
-                            if len(fmt_data) >= 14:
-                                sample_rate = struct.unpack('<I', fmt_data[4:8])[0]
-                                byte_rate = struct.unpack('<I', fmt_data[8:12])[0]
-                            # Skip remaining fmt data
-                            remaining = chunk_size - len(fmt_data)
-                            if remaining > 0:
-                                f.seek(remaining, 1)
-                        elif chunk_id == b'data':
-                            # Found data chunk - calculate duration
-                            if byte_rate > 0:
-                                return chunk_size / byte_rate
-                            break
-                        else:
-                            # Skip this chunk
-                            f.seek(chunk_size, 1)
-            except Exception:
-                pass
-        return 0
+            st = os.stat(file_path)
+        except OSError:
+            return 0
+        return _probe_duration(file_path, st.st_mtime_ns, st.st_size)
 
     def play(self):
         """Start or resume playback."""
@@ -419,6 +476,7 @@ class FooterPlayer(ctk.CTkFrame):
             self.is_paused = False
             self.play_btn.configure(text="\u23f8")  # Pause icon
             self._start_ui_update()
+            self._schedule_track_end()
         except Exception as e:
             print(f"Playback error: {e}")
 
@@ -432,9 +490,11 @@ class FooterPlayer(ctk.CTkFrame):
             self.is_playing = False
             self.play_btn.configure(text="\u25b6")  # Play icon
             self._stop_ui_update()
+            self._cancel_track_end()
 
     def stop(self):
         """Stop playback."""
+        self._cancel_pending_seek()
         # STARTUP OPTIMIZATION: Only stop pygame if mixer is initialized
         if self._pygame_ready:
             pygame.mixer.music.stop()
@@ -442,9 +502,10 @@ class FooterPlayer(ctk.CTkFrame):
         self.is_paused = False
         self.position_offset = 0
         self.play_btn.configure(text="\u25b6")
-        self.seek_slider.set(0)
-        self.time_current.configure(text="0:00")
+        self._set_seek_slider(0)
+        self._set_time_current("0:00")
         self._stop_ui_update()
+        self._cancel_track_end()
 
     def toggle_play_pause(self):
         """Toggle between play and pause."""
@@ -462,8 +523,20 @@ class FooterPlayer(ctk.CTkFrame):
         if not self.playlist or self.playlist_index <= 0:
             # Restart current track
             if self.current_sample:
-                self.stop()
-                self.play()
+                if (self.is_playing or self.is_paused) and self._pygame_ready:
+                    # The file is still loaded - rewind instead of reloading it
+                    self._restart_at(0)
+                    self._set_seek_slider(0)
+                    self._set_time_current("0:00")
+                    if not self.is_playing:
+                        self.is_playing = True
+                        self.is_paused = False
+                        self.play_btn.configure(text="\u23f8")
+                        self._start_ui_update()
+                    self._schedule_track_end()
+                else:
+                    self.stop()
+                    self.play()
             return
 
         self.playlist_index -= 1
@@ -487,15 +560,29 @@ class FooterPlayer(ctk.CTkFrame):
     def _on_seek_end(self, event=None):
         """Handle seek slider mouse release - perform actual seek."""
         self._is_seeking = False
-        self._perform_seek(self.seek_slider.get())
+        self._cancel_drag_label()  # The seek sets the final label itself
+        self._request_seek(self.seek_slider.get())
 
     def _on_seek_drag(self, value):
         """Handle seek slider drag - update time display only."""
         if not self.current_sample or self.duration <= 0:
             return
-        # Update time display while dragging
-        target_pos = (value / 100) * self.duration
-        self.time_current.configure(text=self._format_time(target_pos))
+        # PERFORMANCE: The slider fires per pixel; render the latest position
+        # at most every 50 ms instead of reconfiguring the label each time
+        self._pending_drag_pos = (value / 100) * self.duration
+        if self._drag_label_job is None:
+            self._drag_label_job = self.after(50, self._flush_drag_label)
+
+    def _flush_drag_label(self):
+        """Show the latest dragged position in the time label."""
+        self._drag_label_job = None
+        self._set_time_current(self._format_time(self._pending_drag_pos))
+
+    def _cancel_drag_label(self):
+        """Drop a pending drag label update."""
+        if self._drag_label_job is not None:
+            self.after_cancel(self._drag_label_job)
+            self._drag_label_job = None
 
     def seek(self, percentage: float):
         """
@@ -507,7 +594,35 @@ class FooterPlayer(ctk.CTkFrame):
         # Normalize to 0-100 range for internal use
         if percentage <= 1.0:
             percentage = percentage * 100
-        self._perform_seek(percentage)
+        self._request_seek(percentage)
+
+    def _request_seek(self, value: float):
+        """Seek now, or coalesce with other seeks inside a 100 ms window.
+
+        PERFORMANCE: A WAV seek restarts playback and makes SDL_mixer re-read
+        the file, so rapid slider releases or waveform clicks only seek
+        to the last requested position once the window has passed.
+        """
+        self._pending_seek_value = value
+        if self._seek_job is not None:
+            return
+        wait = 0.1 - (time.monotonic() - self._last_seek_at)
+        if wait <= 0:
+            self._flush_seek()
+        else:
+            self._seek_job = self.after(int(wait * 1000) + 1, self._flush_seek)
+
+    def _flush_seek(self):
+        """Perform the most recently requested seek."""
+        self._seek_job = None
+        self._last_seek_at = time.monotonic()
+        self._perform_seek(self._pending_seek_value)
+
+    def _cancel_pending_seek(self):
+        """Drop a coalesced seek that has not run yet."""
+        if self._seek_job is not None:
+            self.after_cancel(self._seek_job)
+            self._seek_job = None
 
     def _perform_seek(self, value):
         """Perform the actual seek operation."""
@@ -532,19 +647,13 @@ class FooterPlayer(ctk.CTkFrame):
                     self.position_offset = target_pos
                 else:
                     # Not playing, start from position
-                    pygame.mixer.music.play(start=target_pos)
-                    pygame.mixer.music.set_volume(self.volume)
-                    self.position_offset = target_pos
-                    self._get_pos_at_seek = 0  # Reset since we called play()
+                    self._restart_at(target_pos)
                     self.is_playing = True
                     self.play_btn.configure(text="\u23f8")
                     self._start_ui_update()
             else:
                 # For WAV and others, restart with start position
-                pygame.mixer.music.play(start=target_pos)
-                pygame.mixer.music.set_volume(self.volume)
-                self.position_offset = target_pos
-                self._get_pos_at_seek = 0  # Reset since we called play()
+                self._restart_at(target_pos)
                 if not self.is_playing and not self.is_paused:
                     self.is_playing = True
                     self.play_btn.configure(text="\u23f8")
@@ -553,11 +662,19 @@ class FooterPlayer(ctk.CTkFrame):
                     pygame.mixer.music.pause()
 
             # Update UI immediately with target position
-            self.time_current.configure(text=self._format_time(target_pos))
-            self.seek_slider.set(value)
+            self._set_time_current(self._format_time(target_pos))
+            self._set_seek_slider(value)
+            self._schedule_track_end()
         except Exception as e:
             print(f"Seek error: {e}")
 
+    def _restart_at(self, pos: float):
+        """Restart the loaded track at pos seconds without reloading the file."""
+        pygame.mixer.music.play(start=pos)
+        pygame.mixer.music.set_volume(self.volume)
+        self.position_offset = pos
+        self._get_pos_at_seek = 0  # get_pos() restarts from 0 after play()
+
     def _on_volume(self, value):
         """Handle volume slider change."""
         self.volume = value / 100
@@ -569,8 +686,24 @@ class FooterPlayer(ctk.CTkFrame):
 
     def _start_ui_update(self):
         """Start periodic UI updates."""
+        self._ui_next_deadline = time.monotonic()
         self._update_ui()
 
+    def _schedule_ui_update(self, interval: float):
+        """Schedule the next UI tick against a monotonic deadline.
+
+        PERFORMANCE: Tk's after() only guarantees a minimum delay, so a fixed
+        after(100) drifts later on a busy UI thread. Deadlines advance by
+        exactly one interval, keeping the tick rate steady on long tracks.
+        """
+        now = time.monotonic()
+        self._ui_next_deadline += interval
+        if self._ui_next_deadline < now:
+            # Fell behind (e.g. a UI stall) - resync instead of bursting
+            self._ui_next_deadline = now + interval
+        delay_ms = max(1, int((self._ui_next_deadline - now) * 1000))
+        self._update_job = self.after(delay_ms, self._update_ui)
+
     def _stop_ui_update(self):
         """Stop periodic UI updates."""
         if self._update_job:
@@ -581,38 +714,41 @@ class FooterPlayer(ctk.CTkFrame):
         """Update UI elements (position, slider).
 
         Performance optimizations:
-        - Early exit if widget is not mapped (not visible)
+        - Early exit if widget is not viewable (hidden or minimized)
         - Cached format strings to reduce object allocations
         - Minimal state reads from pygame
         """
         # Early exit if widget is not visible (e.g., minimized window)
         try:
-            if not self.winfo_ismapped():
-                self._update_job = self.after(250, self._update_ui)  # Slower updates when hidden
+            if not self.winfo_viewable():
+                self._schedule_ui_update(0.5)  # Slower updates when hidden
                 return
         except Exception:
             # Widget may be destroyed
             return
 
-        if self.is_playing and self.duration > 0:
+        # PERFORMANCE: Bind per-tick attributes once; position math below
+        # reads them several times
+        duration = self.duration
+        if self.is_playing and duration > 0:
             # Skip UI updates while user is seeking
             if self._is_seeking:
-                self._update_job = self.after(100, self._update_ui)
+                self._schedule_ui_update(0.1)
                 return
 
             # Check if we recently seeked - use target position for 500ms after seek
             time_since_seek = time.time() - self._seek_time
             if time_since_seek < 0.5:
                 # Use the seek target position to prevent slider jumping back
-                current_pos = self._seek_target + time_since_seek
-                current_pos = min(current_pos, self.duration)
-                progress = (current_pos / self.duration) * 100
-                self.seek_slider.set(progress)
-                self.time_current.configure(text=self._format_time(current_pos))
+                current_pos = min(self._seek_target + time_since_seek, duration)
+                fraction = current_pos / duration
+                self._set_seek_slider(fraction * 100)
+                self._set_time_current(self._format_time(current_pos))
                 # Notify progress callback
-                if self.on_progress:
-                    self.on_progress(progress / 100)  # 0.0-1.0
-                self._update_job = self.after(100, self._update_ui)
+                on_progress = self.on_progress
+                if on_progress:
+                    on_progress(fraction)  # 0.0-1.0
+                self._schedule_ui_update(0.1)
                 return
 
             # Get position from pygame (milliseconds since play started)
@@ -620,28 +756,74 @@ class FooterPlayer(ctk.CTkFrame):
             if pos_ms >= 0:
                 # Calculate position using delta from seek point
                 # This handles the fact that get_pos() doesn't reset after set_pos()
-                delta_ms = pos_ms - self._get_pos_at_seek
-                current_pos = self.position_offset + (delta_ms / 1000)
+                current_pos = self.position_offset + (pos_ms - self._get_pos_at_seek) * 0.001
 
                 # Clamp to duration
-                current_pos = min(current_pos, self.duration)
+                if current_pos > duration:
+                    current_pos = duration
 
-                # Check if track ended
-                if not pygame.mixer.music.get_busy():
+                # Check if track ended (safety net for overlong durations)
+                if self._track_may_have_ended() and not pygame.mixer.music.get_busy():
                     self._on_track_end()
                     return
 
                 # Update slider and time - calculate progress once
-                progress = (current_pos / self.duration) * 100
-                self.seek_slider.set(progress)
-                self.time_current.configure(text=self._format_time(current_pos))
+                fraction = current_pos / duration
+                self._set_seek_slider(fraction * 100)
+                self._set_time_current(self._format_time(current_pos))
 
                 # Notify progress callback
-                if self.on_progress:
-                    self.on_progress(progress / 100)  # 0.0-1.0
+                on_progress = self.on_progress
+                if on_progress:
+                    on_progress(fraction)  # 0.0-1.0
 
         # Schedule next update
-        self._update_job = self.after(100, self._update_ui)
+        self._schedule_ui_update(0.1)
+
+    def _track_may_have_ended(self) -> bool:
+        """Whether this tick should ask the mixer if playback finished.
+
+        PERFORMANCE: The expected end is handled by _end_job, so ticks only
+        poll get_busy() once a second to catch audio that is shorter than
+        its reported duration.
+        """
+        now = time.monotonic()
+        if now - self._last_busy_check >= 1.0:
+            self._last_busy_check = now
+            return True
+        return False
+
+    def _schedule_track_end(self):
+        """Arm a timer for when the current track should finish playing.
+
+        PERFORMANCE: Playback position is known from position_offset and
+        get_pos(), so the end transition fires within a few ms of the real
+        end instead of waiting for a tick to notice get_busy() going False.
+        """
+        self._cancel_track_end()
+        if not self.is_playing or self.duration <= 0:
+            return
+        played = (pygame.mixer.music.get_pos() - self._get_pos_at_seek) / 1000
+        remaining = max(0.0, self.duration - (self.position_offset + played))
+        # Small margin so the mixer has drained the last buffer
+        self._end_job = self.after(int(remaining * 1000) + 50, self._on_expected_end)
+
+    def _on_expected_end(self):
+        """Finish the track, or re-check shortly if the audio runs long."""
+        self._end_job = None
+        if not self.is_playing:
+            return
+        if pygame.mixer.music.get_busy():
+            # Reported duration was short - poll until the mixer is done
+            self._end_job = self.after(250, self._on_expected_end)
+            return
+        self._on_track_end()
+
+    def _cancel_track_end(self):
+        """Cancel the expected-end timer."""
+        if self._end_job is not None:
+            self.after_cancel(self._end_job)
+            self._end_job = None
 
     def _on_track_end(self):
         """Handle track ending."""
@@ -654,11 +836,24 @@ class FooterPlayer(ctk.CTkFrame):
     @staticmethod
     def _format_time(seconds: float) -> str:
         """Format seconds as M:SS."""
-        if seconds < 0:
-            seconds = 0
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{mins}:{secs:02d}"
+        return _format_whole_seconds(max(0, int(seconds)))
+
+    def _set_seek_slider(self, progress: float):
+        """Move the seek slider, skipping redraws within one slider step.
+
+        PERFORMANCE: The slider has 200 steps over 0-100, so on long tracks
+        most 100 ms ticks land on the step already shown.
+        """
+        step = int(progress * 2)
+        if step != self._last_slider_step:
+            self.seek_slider.set(progress)
+            self._last_slider_step = step
+
+    def _set_time_current(self, text: str):
+        """Set the elapsed-time label, skipping the configure if unchanged."""
+        if text != self._last_time_current:
+            self.time_current.configure(text=text)
+            self._last_time_current = text
 
     def _on_destroy(self, event=None):
         """Clean up resources when widget is destroyed.
@@ -669,8 +864,11 @@ class FooterPlayer(ctk.CTkFrame):
         if event and event.widget != self:
             return
 
-        # Cancel any pending UI update timer
+        # Cancel any pending UI update timers
         self._stop_ui_update()
+        self._cancel_drag_label()
+        self._cancel_pending_seek()
+        self._cancel_track_end()
 
         # Destroy any active tooltip
         if self._active_tooltip:
@@ -694,6 +892,10 @@ class FooterPlayer(ctk.CTkFrame):
             widget: The widget to attach the tooltip to.
             text: The tooltip text to display.
         """
+        # PERFORMANCE: Resolve colors and font once per tooltip, not per hover
+        bg_card, fg_secondary = COLORS['bg_card'], COLORS['fg_secondary']
+        font = FontCache.get(11)
+
         def show_tooltip(event):
             # Don't create if one already exists
             if self._active_tooltip:
@@ -704,14 +906,14 @@ class FooterPlayer(ctk.CTkFrame):
             self._active_tooltip = ctk.CTkToplevel(widget)
             self._active_tooltip.wm_overrideredirect(True)
             self._active_tooltip.wm_geometry(f"+{x}+{y}")
-            self._active_tooltip.configure(fg_color=COLORS['bg_card'])
+            self._active_tooltip.configure(fg_color=bg_card)
 
             label = ctk.CTkLabel(
                 self._active_tooltip,
                 text=text,
-                font=ctk.CTkFont(size=11),
-                text_color=COLORS['fg_secondary'],
-                fg_color=COLORS['bg_card'],
+                font=font,
+                text_color=fg_secondary,
+                fg_color=bg_card,
                 corner_radius=4,
                 padx=8,
                 pady=4
@@ -5,14 +5,48 @@ from ui.theme import COLORS, SPACING
 from core.task_manager import get_task_manager
 from datetime import datetime, timedelta
 
-# Try to import matplotlib for charts
-try:
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    from matplotlib.figure import Figure
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+# matplotlib for charts - imported on first use by _load_matplotlib()
+plt = FigureCanvasTkAgg = Figure = None
+MATPLOTLIB_AVAILABLE = None  # Unknown until the first import attempt
+
+
+def _load_matplotlib() -> bool:
+    """Import matplotlib if needed and return whether it is available.
+
+    PERFORMANCE: matplotlib and its Tk backend take hundreds of ms to
+    import, so this waits until the dashboard first draws its charts.
+    """
+    global plt, FigureCanvasTkAgg, Figure, MATPLOTLIB_AVAILABLE
+    if MATPLOTLIB_AVAILABLE is None:
+        try:
+            import matplotlib.pyplot as plt
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            from matplotlib.figure import Figure
+            MATPLOTLIB_AVAILABLE = True
+        except ImportError:
+            MATPLOTLIB_AVAILABLE = False
+    return MATPLOTLIB_AVAILABLE
+
+
+class _ContextColors(dict):
+    """Context tag -> color; unknown tags get the @Other color."""
+
+    def __missing__(self, key):
+        return "#7F8C8D"
+
+
+# Day names by date.weekday(); the UI is English-only
+_WEEKDAY_ABBR = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# Context tag colors
+CONTEXT_COLORS = _ContextColors({
+    "@Studio": "#9B59B6",
+    "@Mixing": "#3498DB",
+    "@Marketing": "#E74C3C",
+    "@Admin": "#95A5A6",
+    "@Other": "#7F8C8D"
+})
 
 
 class ProductivityDashboard(ctk.CTkFrame):
@@ -21,8 +55,23 @@ class ProductivityDashboard(ctk.CTkFrame):
     def __init__(self, parent, **kwargs):
         super().__init__(parent, fg_color=COLORS['bg_main'], **kwargs)
         self.task_manager = get_task_manager()
+        self._today = ""
+        # Last 7 days, oldest first: 'YYYY-MM-DD', short and full day names
+        self._week_date_strs = []
+        self._week_day_names = []
+        self._week_full_names = []
+        self._snapshot = {}  # TaskManager.get_dashboard_snapshot() result
+        self._snapshot_version = None  # (day, data version) of the snapshot
+        self._charts_built = False  # Chart widgets are created once
+        # Data last drawn by the weekly/context charts, to skip redraws
+        self._weekly_key = None
+        self._context_key = None
+        self._focus_key = None
+        self._insights_key = None
+        self._layout_job = None  # Pending deferred tight_layout pass
         self._build_ui()
-        self.refresh()
+        # No refresh here: TasksView refreshes the dashboard when its tab is
+        # shown, so matplotlib and the queries wait until then
 
     def _build_ui(self):
         """Build the dashboard UI."""
@@ -48,12 +97,13 @@ class ProductivityDashboard(ctk.CTkFrame):
             fg_color=COLORS['bg_card'],
             hover_color=COLORS['bg_hover'],
             corner_radius=6,
-            command=self.refresh
+            command=lambda: self.refresh(force=True)
         ).pack(side="right")
 
         # Stats cards row
         self.stats_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.stats_frame.pack(fill="x", padx=SPACING['lg'], pady=SPACING['md'])
+        self._build_stat_cards()
 
         # Charts area (scrollable)
         self.charts_frame = ctk.CTkScrollableFrame(
@@ -63,35 +113,64 @@ class ProductivityDashboard(ctk.CTkFrame):
         )
         self.charts_frame.pack(fill="both", expand=True, padx=SPACING['lg'], pady=SPACING['sm'])
 
-    def refresh(self):
-        """Refresh all dashboard data."""
+    def refresh(self, force: bool = False):
+        """Refresh all dashboard data.
+
+        Args:
+            force: Rebuild even if no data changed since the last refresh.
+        """
+        # PERFORMANCE: Tab switches refresh the dashboard; skip all queries
+        # and widget updates when nothing was written since the last one
+        end_date = datetime.now().date()
+        version = (end_date, self.task_manager.get_data_version())
+        if version == self._snapshot_version and not force:
+            return
+        self._snapshot_version = version
+
+        # PERFORMANCE: Fetch everything once per refresh; cards, charts and
+        # insights read the snapshot instead of re-running the same queries
+        week = [end_date - timedelta(days=6 - i) for i in range(7)]
+        self._week_date_strs = [d.isoformat() for d in week]
+        self._week_day_names = [_WEEKDAY_ABBR[d.weekday()] for d in week]
+        self._week_full_names = [_WEEKDAY_NAMES[d.weekday()] for d in week]
+        self._today = self._week_date_strs[-1]
+        self._snapshot = self.task_manager.get_dashboard_snapshot(
+            self._week_date_strs[0], self._today
+        )
+
         self._update_stats_cards()
         self._update_charts()
 
+    def _build_stat_cards(self):
+        """Create the fixed set of stats cards; refreshes only update values."""
+        self._stat_value_labels = {}
+        for title, color in (
+            ("Today's Tasks", COLORS['accent']),
+            ("Focus Time", COLORS['accent_secondary']),
+            ("Sessions", COLORS['success']),
+            ("Active Projects", COLORS['fg_secondary']),
+        ):
+            card = self._create_stat_card(title, "", color)
+            card.pack(side="left", padx=SPACING['sm'], expand=True, fill="x")
+
     def _update_stats_cards(self):
         """Update the stats cards."""
-        # Clear existing
-        for widget in self.stats_frame.winfo_children():
-            widget.destroy()
-
         # Get stats
-        stats = self.task_manager.get_completion_stats()
-        today = datetime.now().strftime('%Y-%m-%d')
-        sessions = self.task_manager.get_focus_sessions(date=today)
-        completed_sessions = sum(1 for s in sessions if s.get('completed'))
-        focus_minutes = sum(s.get('duration', 0) for s in sessions if s.get('completed')) // 60
+        stats = self._snapshot['stats']
+        focus_today = self._snapshot['focus_by_date'].get(self._today, {})
+        completed_sessions = focus_today.get('sessions', 0)
+        focus_minutes = focus_today.get('minutes', 0)
 
         # Stats data
         cards_data = [
-            ("Today's Tasks", f"{stats['daily_completed']}/{stats['daily_total']}", COLORS['accent']),
-            ("Focus Time", f"{focus_minutes}m", COLORS['accent_secondary']),
-            ("Sessions", str(completed_sessions), COLORS['success']),
-            ("Active Projects", str(stats['active_projects']), COLORS['fg_secondary']),
+            ("Today's Tasks", f"{stats['daily_completed']}/{stats['daily_total']}"),
+            ("Focus Time", f"{focus_minutes}m"),
+            ("Sessions", str(completed_sessions)),
+            ("Active Projects", str(stats['active_projects'])),
         ]
 
-        for title, value, color in cards_data:
-            card = self._create_stat_card(title, value, color)
-            card.pack(side="left", padx=SPACING['sm'], expand=True, fill="x")
+        for title, value in cards_data:
+            self._stat_value_labels[title].configure(text=value)
 
     def _create_stat_card(self, title: str, value: str, accent_color: str) -> ctk.CTkFrame:
         """Create a stat card widget."""
@@ -101,15 +180,18 @@ class ProductivityDashboard(ctk.CTkFrame):
             corner_radius=8,
             height=80
         )
-        card.pack_propagate(False)
 
+        # PERFORMANCE: Fixed positions in a fixed-height card - place() never
+        # propagates, so no geometry negotiation with the card is needed
         # Value (big)
-        ctk.CTkLabel(
+        value_label = ctk.CTkLabel(
             card,
             text=value,
             font=ctk.CTkFont(family="JetBrains Mono", size=28, weight="bold"),
             text_color=accent_color
-        ).pack(pady=(SPACING['md'], 0))
+        )
+        value_label.place(relx=0.5, y=SPACING['md'], anchor="n")
+        self._stat_value_labels[title] = value_label
 
         # Title (small)
         ctk.CTkLabel(
@@ -117,20 +199,30 @@ class ProductivityDashboard(ctk.CTkFrame):
             text=title,
             font=ctk.CTkFont(family="Inter", size=11),
             text_color=COLORS['fg_secondary']
-        ).pack()
+        ).place(relx=0.5, y=50, anchor="n")
 
         return card
 
     def _update_charts(self):
         """Update the charts."""
-        # Clear existing
-        for widget in self.charts_frame.winfo_children():
-            widget.destroy()
-
-        if MATPLOTLIB_AVAILABLE:
-            self._create_matplotlib_charts()
+        # PERFORMANCE: Chart widgets are built once and only their data is
+        # updated on refresh; unchanged charts are skipped entirely
+        use_matplotlib = _load_matplotlib()
+        if not self._charts_built:
+            if use_matplotlib:
+                self._create_matplotlib_charts()
+            else:
+                self._create_text_charts()
+            self._charts_built = True
+
+        if use_matplotlib:
+            self._update_weekly_chart()
+            self._update_context_chart()
+            self._update_focus_chart()
+            self._update_insights_panel()
         else:
-            self._create_text_charts()
+            self._update_text_weekly_stats()
+            self._update_text_context_stats()
 
     def _create_matplotlib_charts(self):
         """Create charts using matplotlib."""
@@ -151,102 +243,151 @@ class ProductivityDashboard(ctk.CTkFrame):
         self._create_focus_chart(row2)
         self._create_insights_panel(row2)
 
-    def _create_weekly_chart(self, parent):
-        """Create weekly completion bar chart."""
+        # PERFORMANCE: Fit margins once the first data and tick labels are
+        # in, after the dashboard has painted, rather than while building
+        self._schedule_layout()
+
+    def _schedule_layout(self):
+        """Queue one tight_layout pass for the next idle tick.
+
+        Called again whenever an update changes a y-limit, since wider y
+        tick labels would otherwise be clipped by the old margins.
+        """
+        if self._layout_job is None:
+            self._layout_job = self.after_idle(self._layout_charts)
+
+    def _layout_charts(self):
+        """Fit chart margins to their labels and redraw."""
+        self._layout_job = None
+        for canvas in (self._weekly_canvas, self._context_canvas, self._focus_canvas):
+            canvas.figure.tight_layout()
+            canvas.draw_idle()
+
+    def _create_chart_card(self, parent, title: str, padx) -> ctk.CTkFrame:
+        """Create a titled card for a chart."""
         card = ctk.CTkFrame(parent, fg_color=COLORS['bg_card'], corner_radius=8)
-        card.pack(side="left", fill="both", expand=True, padx=(0, SPACING['sm']))
+        card.pack(side="left", fill="both", expand=True, padx=padx)
 
         ctk.CTkLabel(
             card,
-            text="Tasks Completed (Last 7 Days)",
+            text=title,
             font=ctk.CTkFont(family="Inter", size=13, weight="bold"),
             text_color=COLORS['fg']
         ).pack(pady=(SPACING['md'], SPACING['xs']))
 
-        # Get data
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=6)
-        stats = self.task_manager.get_completion_stats_by_date(
-            start_date.strftime('%Y-%m-%d'),
-            end_date.strftime('%Y-%m-%d')
-        )
+        return card
 
-        # Build data for all 7 days
-        date_counts = {s['date']: s['count'] for s in stats}
-        days = []
-        counts = []
-        for i in range(7):
-            date = (start_date + timedelta(days=i)).strftime('%Y-%m-%d')
-            day_name = (start_date + timedelta(days=i)).strftime('%a')
-            days.append(day_name)
-            counts.append(date_counts.get(date, 0))
-
-        # Create chart
+    def _create_chart_figure(self):
+        """Create a dark chart figure with a single subplot."""
         fig = Figure(figsize=(4, 2.5), dpi=100, facecolor=COLORS['bg_card'])
         ax = fig.add_subplot(111)
         ax.set_facecolor(COLORS['bg_card'])
+        return fig, ax
 
-        bars = ax.bar(days, counts, color=COLORS['accent'], width=0.6)
-        ax.set_ylabel('Tasks', fontsize=9, color=COLORS['fg_secondary'])
+    @staticmethod
+    def _style_axes(ax, ylabel: str):
+        """Apply the dashboard's axis styling."""
+        ax.set_xticks(range(7))
+        ax.set_ylabel(ylabel, fontsize=9, color=COLORS['fg_secondary'])
         ax.tick_params(colors=COLORS['fg_secondary'], labelsize=8)
         ax.spines['top'].set_visible(False)
         ax.spines['right'].set_visible(False)
         ax.spines['bottom'].set_color(COLORS['border'])
         ax.spines['left'].set_color(COLORS['border'])
 
-        # Add value labels on bars
-        for bar, count in zip(bars, counts):
-            if count > 0:
-                ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1,
-                       str(count), ha='center', va='bottom',
-                       fontsize=8, color=COLORS['fg'])
-
-        fig.tight_layout()
-
+    def _embed_figure(self, card, fig) -> "FigureCanvasTkAgg":
+        """Embed a figure in a card and return its canvas."""
         canvas = FigureCanvasTkAgg(fig, card)
-        canvas.draw()
         canvas.get_tk_widget().pack(fill="both", expand=True, padx=SPACING['sm'], pady=SPACING['sm'])
+        return canvas
+
+    def _create_weekly_chart(self, parent):
+        """Create weekly completion bar chart."""
+        card = self._create_chart_card(parent, "Tasks Completed (Last 7 Days)", (0, SPACING['sm']))
+
+        fig, ax = self._create_chart_figure()
+        self._weekly_bars = ax.bar(range(7), [0] * 7, color=COLORS['accent'], width=0.6)
+        self._style_axes(ax, 'Tasks')
+        self._weekly_value_labels = []
+
+        self._weekly_ax = ax
+        self._weekly_canvas = self._embed_figure(card, fig)
+
+    def _update_weekly_chart(self):
+        """Show the current week's completion counts."""
+        # Build data for all 7 days
+        date_counts = {s['date']: s['count'] for s in self._snapshot['by_date']}
+        counts = [date_counts.get(date, 0) for date in self._week_date_strs]
+
+        key = (tuple(self._week_day_names), tuple(counts))
+        if key == self._weekly_key:
+            return
+        self._weekly_key = key
+
+        ax = self._weekly_ax
+        for bar, count in zip(self._weekly_bars, counts):
+            bar.set_height(count)
+        ax.set_xticklabels(self._week_day_names)
+        ymax = max(max(counts), 1) * 1.15  # Headroom for value labels
+        if ymax != ax.get_ylim()[1]:
+            ax.set_ylim(0, ymax)
+            self._schedule_layout()
+
+        # Replace value labels on bars
+        for text in self._weekly_value_labels:
+            text.remove()
+        self._weekly_value_labels = [
+            ax.text(bar.get_x() + bar.get_width()/2, count + 0.1,
+                    str(count), ha='center', va='bottom',
+                    fontsize=8, color=COLORS['fg'])
+            for bar, count in zip(self._weekly_bars, counts) if count > 0
+        ]
+
+        self._weekly_canvas.draw_idle()
 
     def _create_context_chart(self, parent):
         """Create context distribution pie chart."""
-        card = ctk.CTkFrame(parent, fg_color=COLORS['bg_card'], corner_radius=8)
-        card.pack(side="left", fill="both", expand=True, padx=(SPACING['sm'], 0))
+        card = self._create_chart_card(parent, "Tasks by Context", (SPACING['sm'], 0))
 
-        ctk.CTkLabel(
+        # Shown instead of the chart until tasks are completed
+        self._context_empty_label = ctk.CTkLabel(
             card,
-            text="Tasks by Context",
-            font=ctk.CTkFont(family="Inter", size=13, weight="bold"),
-            text_color=COLORS['fg']
-        ).pack(pady=(SPACING['md'], SPACING['xs']))
+            text="No completed tasks yet",
+            font=ctk.CTkFont(family="Inter", size=12),
+            text_color=COLORS['fg_secondary']
+        )
+
+        fig, ax = self._create_chart_figure()
 
+        self._context_ax = ax
+        self._context_canvas = self._embed_figure(card, fig)
+
+    def _update_context_chart(self):
+        """Show the current context distribution."""
         # Get data
-        stats = self.task_manager.get_completion_stats_by_context()
+        stats = self._snapshot['by_context']
 
-        if not stats:
-            ctk.CTkLabel(
-                card,
-                text="No completed tasks yet",
-                font=ctk.CTkFont(family="Inter", size=12),
-                text_color=COLORS['fg_secondary']
-            ).pack(pady=SPACING['xl'])
+        key = tuple((s['context'], s['count']) for s in stats)
+        if key == self._context_key:
             return
+        self._context_key = key
+
+        canvas_widget = self._context_canvas.get_tk_widget()
 
-        # Context colors
-        context_colors = {
-            "@Studio": "#9B59B6",
-            "@Mixing": "#3498DB",
-            "@Marketing": "#E74C3C",
-            "@Admin": "#95A5A6",
-            "@Other": "#7F8C8D"
-        }
+        if not stats:
+            canvas_widget.pack_forget()
+            self._context_empty_label.pack(pady=SPACING['xl'])
+            return
+        self._context_empty_label.pack_forget()
+        canvas_widget.pack(fill="both", expand=True, padx=SPACING['sm'], pady=SPACING['sm'])
 
         labels = [s['context'] or '@Other' for s in stats]
         sizes = [s['count'] for s in stats]
-        colors = [context_colors.get(l, "#7F8C8D") for l in labels]
+        colors = list(map(CONTEXT_COLORS.__getitem__, labels))
 
-        # Create chart
-        fig = Figure(figsize=(4, 2.5), dpi=100, facecolor=COLORS['bg_card'])
-        ax = fig.add_subplot(111)
+        # Wedge count and labels change, so redraw the pie on the same axes
+        ax = self._context_ax
+        ax.clear()
         ax.set_facecolor(COLORS['bg_card'])
 
         wedges, texts, autotexts = ax.pie(
@@ -259,60 +400,44 @@ class ProductivityDashboard(ctk.CTkFrame):
             autotext.set_color(COLORS['fg'])
             autotext.set_fontsize(8)
 
-        fig.tight_layout()
-
-        canvas = FigureCanvasTkAgg(fig, card)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=SPACING['sm'], pady=SPACING['sm'])
+        self._context_canvas.draw_idle()
 
     def _create_focus_chart(self, parent):
         """Create focus sessions chart."""
-        card = ctk.CTkFrame(parent, fg_color=COLORS['bg_card'], corner_radius=8)
-        card.pack(side="left", fill="both", expand=True, padx=(0, SPACING['sm']))
+        card = self._create_chart_card(parent, "Focus Sessions (Last 7 Days)", (0, SPACING['sm']))
 
-        ctk.CTkLabel(
-            card,
-            text="Focus Sessions (Last 7 Days)",
-            font=ctk.CTkFont(family="Inter", size=13, weight="bold"),
-            text_color=COLORS['fg']
-        ).pack(pady=(SPACING['md'], SPACING['xs']))
+        fig, ax = self._create_chart_figure()
+        self._focus_line, = ax.plot(range(7), [0] * 7, color=COLORS['accent_secondary'],
+                                    linewidth=2, marker='o', markersize=4)
+        self._focus_fill = None
+        self._style_axes(ax, 'Minutes')
 
-        # Get data for last 7 days
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=6)
-
-        days = []
-        minutes = []
-        for i in range(7):
-            date = (start_date + timedelta(days=i)).strftime('%Y-%m-%d')
-            day_name = (start_date + timedelta(days=i)).strftime('%a')
-            sessions = self.task_manager.get_focus_sessions(date=date)
-            total_mins = sum(s.get('duration', 0) for s in sessions if s.get('completed')) // 60
-            days.append(day_name)
-            minutes.append(total_mins)
-
-        # Create chart
-        fig = Figure(figsize=(4, 2.5), dpi=100, facecolor=COLORS['bg_card'])
-        ax = fig.add_subplot(111)
-        ax.set_facecolor(COLORS['bg_card'])
+        self._focus_ax = ax
+        self._focus_canvas = self._embed_figure(card, fig)
 
-        ax.fill_between(range(len(days)), minutes, color=COLORS['accent_secondary'], alpha=0.3)
-        ax.plot(range(len(days)), minutes, color=COLORS['accent_secondary'], linewidth=2, marker='o', markersize=4)
+    def _update_focus_chart(self):
+        """Show the current week's focus minutes."""
+        # Get data for last 7 days
+        focus_by_date = self._snapshot['focus_by_date']
+        minutes = [focus_by_date.get(date, {}).get('minutes', 0) for date in self._week_date_strs]
 
-        ax.set_xticks(range(len(days)))
-        ax.set_xticklabels(days)
-        ax.set_ylabel('Minutes', fontsize=9, color=COLORS['fg_secondary'])
-        ax.tick_params(colors=COLORS['fg_secondary'], labelsize=8)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['bottom'].set_color(COLORS['border'])
-        ax.spines['left'].set_color(COLORS['border'])
+        key = (tuple(self._week_day_names), tuple(minutes))
+        if key == self._focus_key:
+            return
+        self._focus_key = key
 
-        fig.tight_layout()
+        ax = self._focus_ax
+        self._focus_line.set_ydata(minutes)
+        if self._focus_fill is not None:
+            self._focus_fill.remove()
+        self._focus_fill = ax.fill_between(range(7), minutes, color=COLORS['accent_secondary'], alpha=0.3)
+        ax.set_xticklabels(self._week_day_names)
+        ymax = max(max(minutes), 1) * 1.1
+        if ymax != ax.get_ylim()[1]:
+            ax.set_ylim(0, ymax)
+            self._schedule_layout()
 
-        canvas = FigureCanvasTkAgg(fig, card)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=SPACING['sm'], pady=SPACING['sm'])
+        self._focus_canvas.draw_idle()
 
     def _create_insights_panel(self, parent):
         """Create insights/tips panel."""
@@ -326,11 +451,22 @@ class ProductivityDashboard(ctk.CTkFrame):
             text_color=COLORS['fg']
         ).pack(pady=(SPACING['md'], SPACING['sm']))
 
+        self._insights_frame = ctk.CTkFrame(card, fg_color="transparent")
+        self._insights_frame.pack(fill="x")
+
+    def _update_insights_panel(self):
+        """Show the current insights."""
         # Generate insights
         insights = self._generate_insights()
+        if insights == self._insights_key:
+            return
+        self._insights_key = insights
+
+        for widget in self._insights_frame.winfo_children():
+            widget.destroy()
 
         for insight in insights:
-            insight_row = ctk.CTkFrame(card, fg_color="transparent")
+            insight_row = ctk.CTkFrame(self._insights_frame, fg_color="transparent")
             insight_row.pack(fill="x", padx=SPACING['md'], pady=SPACING['xs'])
 
             ctk.CTkLabel(
@@ -355,8 +491,8 @@ class ProductivityDashboard(ctk.CTkFrame):
         insights = []
 
         # Get stats
-        stats = self.task_manager.get_completion_stats()
-        context_stats = self.task_manager.get_completion_stats_by_context()
+        stats = self._snapshot['stats']
+        context_stats = self._snapshot['by_context']
 
         # Completion rate insight
         if stats['daily_total'] > 0:
@@ -374,9 +510,7 @@ class ProductivityDashboard(ctk.CTkFrame):
             insights.append(f"Most active in {top_context['context'] or '@Other'} ({top_context['count']} tasks).")
 
         # Focus time insight
-        today = datetime.now().strftime('%Y-%m-%d')
-        sessions = self.task_manager.get_focus_sessions(date=today)
-        completed_sessions = sum(1 for s in sessions if s.get('completed'))
+        completed_sessions = self._snapshot['focus_by_date'].get(self._today, {}).get('sessions', 0)
         if completed_sessions > 0:
             insights.append(f"{completed_sessions} focus sessions completed today!")
         else:
@@ -417,50 +551,61 @@ class ProductivityDashboard(ctk.CTkFrame):
             text_color=COLORS['fg']
         ).pack(pady=(SPACING['md'], SPACING['sm']))
 
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=6)
-        stats = self.task_manager.get_completion_stats_by_date(
-            start_date.strftime('%Y-%m-%d'),
-            end_date.strftime('%Y-%m-%d')
-        )
-
-        date_counts = {s['date']: s['count'] for s in stats}
-
-        for i in range(7):
-            date = start_date + timedelta(days=i)
-            date_str = date.strftime('%Y-%m-%d')
-            day_name = date.strftime('%A')
-            count = date_counts.get(date_str, 0)
-
+        # One row per day; refreshes update the labels and bar in place
+        self._text_weekly_rows = []
+        for _ in range(7):
             row = ctk.CTkFrame(card, fg_color="transparent")
             row.pack(fill="x", padx=SPACING['lg'], pady=2)
 
-            ctk.CTkLabel(
+            day_label = ctk.CTkLabel(
                 row,
-                text=day_name,
+                text="",
                 font=ctk.CTkFont(family="Inter", size=12),
                 text_color=COLORS['fg_secondary'],
                 width=100,
                 anchor="w"
-            ).pack(side="left")
+            )
+            day_label.pack(side="left")
 
-            # Simple bar
-            bar_width = min(count * 20, 200)
-            if bar_width > 0:
-                bar = ctk.CTkFrame(row, fg_color=COLORS['accent'], height=16, width=bar_width, corner_radius=4)
-                bar.pack(side="left", padx=SPACING['sm'])
-                bar.pack_propagate(False)
+            # Simple bar (packed only when the count is non-zero)
+            bar = ctk.CTkFrame(row, fg_color=COLORS['accent'], height=16, width=1, corner_radius=4)
+            bar.pack_propagate(False)
 
-            ctk.CTkLabel(
+            count_label = ctk.CTkLabel(
                 row,
-                text=str(count),
+                text="",
                 font=ctk.CTkFont(family="JetBrains Mono", size=12),
                 text_color=COLORS['fg']
-            ).pack(side="left", padx=SPACING['sm'])
+            )
+            count_label.pack(side="left", padx=SPACING['sm'])
+
+            self._text_weekly_rows.append((day_label, bar, count_label))
 
         # Padding at bottom
         ctk.CTkFrame(card, fg_color="transparent", height=SPACING['md']).pack()
 
+    def _update_text_weekly_stats(self):
+        """Show the current week's completion counts as text rows."""
+        date_counts = {s['date']: s['count'] for s in self._snapshot['by_date']}
+        counts = [date_counts.get(date, 0) for date in self._week_date_strs]
+
+        key = (tuple(self._week_full_names), tuple(counts))
+        if key == self._weekly_key:
+            return
+        self._weekly_key = key
+
+        for (day_label, bar, count_label), day_name, count in zip(
+                self._text_weekly_rows, self._week_full_names, counts):
+            day_label.configure(text=day_name)
+            count_label.configure(text=str(count))
+
+            bar_width = min(count * 20, 200)
+            if bar_width > 0:
+                bar.configure(width=bar_width)
+                bar.pack(side="left", padx=SPACING['sm'], before=count_label)
+            else:
+                bar.pack_forget()
+
     def _create_text_context_stats(self):
         """Create text-based context stats."""
         card = ctk.CTkFrame(self.charts_frame, fg_color=COLORS['bg_card'], corner_radius=8)
@@ -473,34 +618,44 @@ class ProductivityDashboard(ctk.CTkFrame):
             text_color=COLORS['fg']
         ).pack(pady=(SPACING['md'], SPACING['sm']))
 
-        stats = self.task_manager.get_completion_stats_by_context()
+        # Rows are rebuilt only when the context breakdown changes
+        self._text_context_body = ctk.CTkFrame(card, fg_color="transparent")
+        self._text_context_body.pack(fill="x")
+
+        # Padding at bottom
+        ctk.CTkFrame(card, fg_color="transparent", height=SPACING['md']).pack()
+
+    def _update_text_context_stats(self):
+        """Show the current context distribution as text rows."""
+        stats = self._snapshot['by_context']
+
+        key = tuple((s['context'], s['count']) for s in stats)
+        if key == self._context_key:
+            return
+        self._context_key = key
+
+        body = self._text_context_body
+        for widget in body.winfo_children():
+            widget.destroy()
 
         if not stats:
             ctk.CTkLabel(
-                card,
+                body,
                 text="No completed tasks yet",
                 font=ctk.CTkFont(family="Inter", size=12),
                 text_color=COLORS['fg_secondary']
             ).pack(pady=SPACING['md'])
             return
 
-        context_colors = {
-            "@Studio": "#9B59B6",
-            "@Mixing": "#3498DB",
-            "@Marketing": "#E74C3C",
-            "@Admin": "#95A5A6",
-            "@Other": "#7F8C8D"
-        }
-
         total = sum(s['count'] for s in stats)
 
         for stat in stats:
             context = stat['context'] or '@Other'
             count = stat['count']
             percent = (count / total * 100) if total > 0 else 0
-            color = context_colors.get(context, "#7F8C8D")
+            color = CONTEXT_COLORS[context]
 
-            row = ctk.CTkFrame(card, fg_color="transparent")
+            row = ctk.CTkFrame(body, fg_color="transparent")
             row.pack(fill="x", padx=SPACING['lg'], pady=2)
 
             # Color dot
@@ -522,6 +677,3 @@ class ProductivityDashboard(ctk.CTkFrame):
                 font=ctk.CTkFont(family="JetBrains Mono", size=12),
                 text_color=COLORS['fg_secondary']
             ).pack(side="right")
-
-        # Padding at bottom
-        ctk.CTkFrame(card, fg_color="transparent", height=SPACING['md']).pack()
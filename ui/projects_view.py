@@ -9,12 +9,16 @@ from core.task_manager import get_task_manager
 class ProjectTemplateDialog(ctk.CTkToplevel):
     """Dialog for selecting project template or creating blank project."""
 
+    TEMPLATE_BATCH_SIZE = 4  # Template cards created per event-loop turn
+
     def __init__(self, parent, task_manager):
         super().__init__(parent)
         self.task_manager = task_manager
         self.selected_template = None
         self.project_title = None
         self.create_blank = False
+        self._pending_templates = []  # Template cards not created yet
+        self._template_batch_job = None
 
         self.title("New Project")
         self.geometry("500x580")
@@ -66,10 +70,11 @@ class ProjectTemplateDialog(ctk.CTkToplevel):
         templates_frame.grid(row=1, column=0, sticky="nsew", padx=SPACING['lg'], pady=SPACING['sm'])
 
         # Get templates
-        templates = self.task_manager.get_project_templates()
-
-        for template in templates:
-            self._create_template_card(templates_frame, template)
+        # PERFORMANCE: Create the first cards now so the dialog opens filled,
+        # and the rest in small idle batches so it stays responsive
+        self._templates_frame = templates_frame
+        self._pending_templates = self.task_manager.get_project_templates()
+        self._create_next_template_batch()
 
         # Bottom buttons (row 2, fixed)
         btn_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -101,6 +106,23 @@ class ProjectTemplateDialog(ctk.CTkToplevel):
         )
         cancel_btn.pack(fill="x")
 
+    def _create_next_template_batch(self):
+        """Create the next few template cards, then yield to the event loop."""
+        self._template_batch_job = None
+        batch = self._pending_templates[:self.TEMPLATE_BATCH_SIZE]
+        del self._pending_templates[:self.TEMPLATE_BATCH_SIZE]
+        for template in batch:
+            self._create_template_card(self._templates_frame, template)
+        if self._pending_templates:
+            self._template_batch_job = self.after(1, self._create_next_template_batch)
+
+    def destroy(self):
+        """Cancel pending card creation before closing."""
+        if self._template_batch_job is not None:
+            self.after_cancel(self._template_batch_job)
+            self._template_batch_job = None
+        super().destroy()
+
     def _create_template_card(self, parent, template):
         """Create a clickable template card."""
         card = ctk.CTkFrame(
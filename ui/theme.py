@@ -3,6 +3,7 @@
 
 import os
 import sys
+from tkinter import font as tkfont
 import customtkinter as ctk
 
 # =============================================================================
@@ -165,6 +166,41 @@ FONTS = {
     'mono_data': (FONT_MONO, 11),            # BPM/Key values - 11px tier
 }
 
+# =============================================================================
+# PERFORMANCE: Shared font cache to avoid repeated CTkFont instantiation
+# =============================================================================
+class FontCache:
+    """Cache for CTkFont objects to avoid repeated instantiation."""
+    _cache: dict = {}
+    _families: dict = {}      # Requested family -> usable family
+    _installed: frozenset = None
+
+    @classmethod
+    def family(cls, family: str) -> str:
+        """Return family if Tk has it installed, else FONT_PRIMARY.
+
+        The installed font list is read once per process; needs a Tk root.
+        """
+        resolved = cls._families.get(family)
+        if resolved is None:
+            if cls._installed is None:
+                cls._installed = frozenset(tkfont.families())
+            resolved = family if family in cls._installed else FONT_PRIMARY
+            cls._families[family] = resolved
+        return resolved
+
+    @classmethod
+    def get(cls, size: int = 12, weight: str = "normal", family: str = None) -> ctk.CTkFont:
+        """Get or create a cached font."""
+        key = (size, weight, family)
+        if key not in cls._cache:
+            if family:
+                cls._cache[key] = ctk.CTkFont(family=cls.family(family), size=size, weight=weight)
+            else:
+                cls._cache[key] = ctk.CTkFont(size=size, weight=weight)
+        return cls._cache[key]
+
+
 # =============================================================================
 # SPACING - Compact 4px grid for professional density
 # Pure 4px scale: 4, 8, 12, 16, 20, 24